@@ -1,3 +1,17 @@
 """Fern - Voice training feedback companion."""
 
+import importlib
+
 __version__ = "0.1.0"
+
+# Submodules resolved on first attribute access, so `import fern` stays cheap
+_LAZY_SUBMODULES = frozenset({
+    "analysis", "capture", "cli", "config", "db", "errors", "logging",
+    "models", "websocket_server",
+})
+
+
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
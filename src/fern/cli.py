@@ -8,13 +8,10 @@ from typing import Optional
 import typer
 from rich.console import Console
 from rich.panel import Panel
-from rich.table import Table
 from rich.text import Text
 from rich.align import Align
 from rich.box import ROUNDED
-from rich import print as rprint
 from datetime import datetime
-import csv
 import json
 import os
 
@@ -124,6 +121,42 @@ def _get_sparkline(values: list, max_width: int = 20) -> str:
     return spark
 
 
+def _record_audio(duration: int, device: Optional[int], sample_rate: int = 44100):
+    """Record mono audio from the microphone.
+
+    Args:
+        duration: Recording duration in seconds
+        device: Audio device ID, or None for the default input
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        1-D float32 numpy array of samples
+
+    Raises:
+        FernError: If the audio device cannot be used
+    """
+    import numpy as np
+    import sounddevice as sd
+
+    try:
+        audio_data = sd.rec(
+            duration * sample_rate,
+            samplerate=sample_rate,
+            channels=1,
+            device=device,
+            dtype=np.float32
+        )
+        sd.wait()
+    except sd.PortAudioError as e:
+        if "Device unavailable" in str(e) or "busy" in str(e).lower():
+            raise create_error("FERN-102", technical_details=str(e))
+        elif "Invalid sample rate" in str(e):
+            raise create_error("FERN-104", technical_details=str(e))
+        else:
+            raise wrap_exception(e, "FERN-103", {"operation": "audio_capture"})
+    return audio_data.flatten()
+
+
 def _format_duration(seconds: float) -> str:
     """Format duration in human-readable format."""
     if seconds < 60:
@@ -210,8 +243,6 @@ def test(
     from .analysis import extract_pitch_from_audio, extract_resonance_from_audio
     from .db import get_default_db
     from .config import load_config, get_default_config_path, ConfigFileNotFoundError
-    import sounddevice as sd
-    import numpy as np
 
     console.print(Panel.fit(
         f"[bold blue]Testing Pitch Detection[/bold blue]\n"
@@ -237,37 +268,22 @@ def test(
         # Record audio
         console.print("\n🎤 [cyan]Recording... Speak now![/cyan]")
 
-        try:
-            audio_data = sd.rec(
-                duration * 44100,
-                samplerate=44100,
-                channels=1,
-                device=device,
-                dtype=np.float32
-            )
-            sd.wait()
-            console.print("✓ Recording complete!")
-            log_capture("completed", device=str(device) if device else "default", sample_rate=44100)
-        except sd.PortAudioError as e:
-            if "Device unavailable" in str(e) or "busy" in str(e).lower():
-                raise create_error("FERN-102", technical_details=str(e))
-            elif "Invalid sample rate" in str(e):
-                raise create_error("FERN-104", technical_details=str(e))
-            else:
-                raise wrap_exception(e, "FERN-103", {"operation": "audio_capture"})
+        audio_data = _record_audio(duration, device, 44100)
+        console.print("✓ Recording complete!")
+        log_capture("completed", device=str(device) if device else "default", sample_rate=44100)
 
         # Extract pitch
         console.print("🔍 [cyan]Analyzing pitch...[/cyan]")
 
         try:
-            pitch_result = extract_pitch_from_audio(audio_data.flatten(), 44100)
+            pitch_result = extract_pitch_from_audio(audio_data, 44100)
         except Exception as e:
             logger.exception("Pitch extraction failed", exc=e)
             raise wrap_exception(e, "FERN-200")
 
         # Extract resonance
         try:
-            resonance_result = extract_resonance_from_audio(audio_data.flatten(), 44100)
+            resonance_result = extract_resonance_from_audio(audio_data, 44100)
         except Exception as e:
             logger.exception("Resonance extraction failed", exc=e)
             raise wrap_exception(e, "FERN-203")
@@ -358,6 +374,8 @@ def trend(
     sparkline: bool = typer.Option(False, "--sparkline", "-s", help="Show ASCII sparkline")
 ):
     """Show pitch trend over time."""
+    from rich.table import Table
+
     from .db import get_default_db
 
     console.print(Panel.fit(
@@ -473,6 +491,8 @@ def sessions(
     limit: int = typer.Option(10, "--limit", "-l", help="Maximum sessions to show")
 ):
     """List recent training sessions."""
+    from rich.table import Table
+
     from .db import get_default_db
 
     console.print(Panel.fit(
@@ -534,6 +554,10 @@ def review(
     export: Optional[str] = typer.Option(None, "--export", "-e", help="Export format: csv, json")
 ):
     """Review a specific session in detail."""
+    import csv
+
+    from rich.table import Table
+
     from .db import get_default_db
 
     console.print(Panel.fit(
@@ -635,6 +659,7 @@ def export(
     """Export training data."""
     from .db import get_default_db
     from datetime import timedelta
+    import csv
 
     format_map = {"csv": "CSV", "json": "JSON"}
     format_name = format_map.get(format, format.upper())
@@ -4,10 +4,17 @@ Handles Fern configuration, target ranges, and user preferences.
 """
 
 import json
+import math
 import os
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ConfigError(Exception):
     """Base exception for configuration errors."""
@@ -83,8 +90,34 @@ def save_config(config: Dict[str, Any], path: Path) -> None:
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    path.write_bytes(_encode_config(config))
+
+
+def _encode_config(config: Dict[str, Any]) -> bytes:
+    """Encode a configuration as indented UTF-8 JSON.
+
+    orjson output is equivalent JSON but not byte-identical (floats such
+    as 1e-07 are written as 1e-7). It writes NaN and infinity as null, so
+    configs holding them, or anything else orjson rejects (e.g. non-string
+    keys), go through json instead.
+    """
+    if ORJSON_AVAILABLE and not _has_non_finite(config):
+        try:
+            return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return json.dumps(config, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _has_non_finite(value: Any) -> bool:
+    """Check whether a value contains a NaN or infinite float."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(v) for v in value)
+    return False
 
 
 def save_config_with_backup(config: Dict[str, Any], path: Path) -> None:
@@ -4,13 +4,231 @@ Manages persistence for sessions, readings, targets, and configuration.
 """
 
 import sqlite3
+import sys
+import threading
 from contextlib import contextmanager
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Generator, List, Optional, Tuple, Any
+from typing import ClassVar, Dict, Generator, Iterator, List, Optional, Set, Tuple, Any
 
 from .models import Session, Reading, Target, SessionSummary
 
+# Size of the driver's per-connection prepared-statement LRU. CPython
+# 3.12.0-3.12.2 can hand back stale cached statements, so caching is
+# disabled on those releases.
+_CACHED_STATEMENTS = 0 if (3, 12, 0) <= sys.version_info[:3] <= (3, 12, 2) else 256
+
+# Rows pulled per fetchmany() call when streaming results.
+_FETCH_BATCH_SIZE = 256
+
+# Minimum time between two PRAGMA optimize runs on the same database.
+_OPTIMIZE_INTERVAL = timedelta(minutes=15)
+
+_INSERT_READING_SQL = """
+    INSERT INTO readings (
+        session_id, timestamp, median_pitch, mean_pitch, min_pitch,
+        max_pitch, std_pitch, voiced_frames, total_frames, voicing_rate,
+        f1_mean, f2_mean, f3_mean, f1_std, f2_std, f3_std,
+        clip_path, duration_seconds, device_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Column lists in dataclass field order, so rows can be unpacked positionally
+# instead of looked up by name.
+_SESSION_COLUMNS = (
+    "id, name, start_time, end_time, target_id, reading_count,"
+    " avg_median_pitch, avg_voicing_rate, notes"
+)
+
+_READING_COLUMNS = (
+    "id, session_id, timestamp, median_pitch, mean_pitch, min_pitch,"
+    " max_pitch, std_pitch, voiced_frames, total_frames, voicing_rate,"
+    " f1_mean, f2_mean, f3_mean, f1_std, f2_std, f3_std,"
+    " clip_path, duration_seconds, device_id"
+)
+
+_TARGET_COLUMNS = (
+    "id, name, created_at, min_pitch, max_pitch, voice_type, target_f2, is_active"
+)
+
+_SESSION_TIME_COLUMNS = ("start_time", "end_time")
+_READING_TIME_COLUMNS = ("timestamp",)
+_TARGET_TIME_COLUMNS = ("created_at",)
+
+_SESSIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT,
+        start_time INTEGER NOT NULL,
+        end_time INTEGER,
+        target_id INTEGER,
+        reading_count INTEGER DEFAULT 0,
+        avg_median_pitch REAL DEFAULT 0.0,
+        avg_voicing_rate REAL DEFAULT 0.0,
+        notes TEXT,
+        FOREIGN KEY (target_id) REFERENCES targets(id)
+    )
+"""
+
+_READINGS_TABLE = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id INTEGER NOT NULL,
+        timestamp INTEGER NOT NULL,
+        median_pitch REAL DEFAULT 0.0,
+        mean_pitch REAL DEFAULT 0.0,
+        min_pitch REAL DEFAULT 0.0,
+        max_pitch REAL DEFAULT 0.0,
+        std_pitch REAL DEFAULT 0.0,
+        voiced_frames INTEGER DEFAULT 0,
+        total_frames INTEGER DEFAULT 0,
+        voicing_rate REAL DEFAULT 0.0,
+        f1_mean REAL DEFAULT 0.0,
+        f2_mean REAL DEFAULT 0.0,
+        f3_mean REAL DEFAULT 0.0,
+        f1_std REAL DEFAULT 0.0,
+        f2_std REAL DEFAULT 0.0,
+        f3_std REAL DEFAULT 0.0,
+        clip_path TEXT,
+        duration_seconds REAL DEFAULT 0.0,
+        device_id INTEGER,
+        FOREIGN KEY (session_id) REFERENCES sessions(id) ON DELETE CASCADE
+    )
+"""
+
+_TARGETS_TABLE = """
+    CREATE TABLE IF NOT EXISTS {table} (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL DEFAULT 'Default',
+        created_at INTEGER NOT NULL,
+        min_pitch REAL NOT NULL DEFAULT 80.0,
+        max_pitch REAL NOT NULL DEFAULT 250.0,
+        voice_type TEXT,
+        target_f2 REAL,
+        is_active INTEGER DEFAULT 1
+    )
+"""
+
+
+def _rebuild_table(
+    conn: sqlite3.Connection,
+    table: str,
+    ddl: str,
+    columns: str,
+    time_columns: Tuple[str, ...] = (),
+) -> None:
+    """Recreate a table from its current DDL, copying the existing rows.
+
+    Args:
+        conn: Connection with an open transaction.
+        table: Name of the table to rebuild.
+        ddl: CREATE TABLE template with a ``{table}`` placeholder.
+        columns: Comma-separated column list to copy.
+        time_columns: Columns to pass through ``iso_to_epoch_us()``.
+    """
+    select = ", ".join(
+        f"iso_to_epoch_us({col})" if col in time_columns else col
+        for col in columns.split(", ")
+    )
+    conn.execute(ddl.format(table=f"{table}_new"))
+    conn.execute(f"INSERT INTO {table}_new ({columns}) SELECT {select} FROM {table}")
+    conn.execute(f"DROP TABLE {table}")
+    conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+
+
+def _to_epoch_us(dt: datetime) -> int:
+    """Convert a naive local datetime to integer epoch microseconds."""
+    return int(dt.replace(microsecond=0).timestamp()) * 1_000_000 + dt.microsecond
+
+
+def _from_epoch_us(value: bytes) -> datetime:
+    """Convert stored epoch microseconds back to a naive local datetime."""
+    seconds, micros = divmod(int(value), 1_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=micros)
+
+
+# datetimes are bound as epoch microseconds via explicit _to_epoch_us() calls
+# (a global adapter would also change how unrelated connections store them),
+# and columns tagged "[epoch_us]" in a SELECT are decoded by the driver
+# (PARSE_COLNAMES).
+sqlite3.register_converter("epoch_us", _from_epoch_us)
+
+
+def _select_list(columns: str, time_columns: Tuple[str, ...]) -> str:
+    """Tag the timestamp columns of a column list for the epoch_us converter."""
+    return ", ".join(
+        f'{col} AS "{col} [epoch_us]"' if col in time_columns else col
+        for col in columns.split(", ")
+    )
+
+
+_SESSION_SELECT = _select_list(_SESSION_COLUMNS, _SESSION_TIME_COLUMNS)
+_READING_SELECT = _select_list(_READING_COLUMNS, _READING_TIME_COLUMNS)
+_TARGET_SELECT = _select_list(_TARGET_COLUMNS, _TARGET_TIME_COLUMNS)
+
+
+# Fixed statement text per filter variant, so every call hits the
+# connection's prepared-statement cache.
+_LIST_SESSIONS_SQL = (
+    f"SELECT {_SESSION_SELECT} FROM sessions"
+    " ORDER BY start_time DESC LIMIT ? OFFSET ?"
+)
+
+_LIST_SESSIONS_BY_TARGET_SQL = (
+    f"SELECT {_SESSION_SELECT} FROM sessions WHERE target_id = ?"
+    " ORDER BY start_time DESC LIMIT ? OFFSET ?"
+)
+
+_ITER_READINGS_SQL = (
+    f"SELECT {_READING_SELECT}, timestamp FROM readings"
+    " WHERE session_id = ? AND (timestamp, id) > (?, ?)"
+    " ORDER BY timestamp, id LIMIT ?"
+)
+
+_TREND_SQL = """
+    SELECT
+        date(timestamp / 1000000, 'unixepoch', 'localtime') as date,
+        AVG(median_pitch) as avg_pitch
+    FROM readings
+    WHERE timestamp >= ?
+    GROUP BY date ORDER BY date
+"""
+
+_TREND_BY_TARGET_SQL = """
+    SELECT
+        date(timestamp / 1000000, 'unixepoch', 'localtime') as date,
+        AVG(median_pitch) as avg_pitch
+    FROM readings
+    WHERE timestamp >= ?
+      AND session_id IN (SELECT id FROM sessions WHERE target_id = ?)
+    GROUP BY date ORDER BY date
+"""
+
+
+def _row_to_session(row: Tuple[Any, ...]) -> Session:
+    """Build a Session from a row selected with ``_SESSION_SELECT``."""
+    return Session(*row)
+
+
+def _row_to_reading(row: Tuple[Any, ...]) -> Reading:
+    """Build a Reading from a row selected with ``_READING_SELECT``."""
+    return Reading(*row)
+
+
+def _row_to_target(row: Tuple[Any, ...]) -> Target:
+    """Build a Target from a row selected with ``_TARGET_SELECT``."""
+    id_, name, created_at, min_pitch, max_pitch, voice_type, target_f2, is_active = row
+    return Target(
+        id=id_,
+        name=name,
+        created_at=created_at,
+        min_pitch=min_pitch,
+        max_pitch=max_pitch,
+        voice_type=voice_type,
+        target_f2=target_f2,
+        is_active=bool(is_active),
+    )
+
 
 class DatabaseError(Exception):
     """Base exception for database errors."""
@@ -30,7 +248,11 @@ class SchemaError(DatabaseError):
 class Database:
     """SQLite database manager for Fern data."""
 
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 3
+
+    # Database files already switched to WAL; journal_mode is persistent, so
+    # it only has to be set once per file rather than on every connection.
+    _wal_enabled: ClassVar[Set[str]] = set()
 
     def __init__(self, db_path: Path):
         """Initialize database connection.
@@ -39,89 +261,99 @@ class Database:
             db_path: Path to the SQLite database file.
         """
         self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
         self._ensure_parent_exists()
 
     def _ensure_parent_exists(self) -> None:
         """Ensure the database parent directory exists."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get the shared connection, opening it on first use.
+
+        Must be called with ``self._lock`` held.
+        """
+        if self._conn is None:
+            conn = sqlite3.connect(
+                str(self.db_path),
+                isolation_level=None,
+                check_same_thread=False,
+                cached_statements=_CACHED_STATEMENTS,
+                detect_types=sqlite3.PARSE_COLNAMES,
+            )
+            conn.row_factory = sqlite3.Row
+            self._configure_connection(conn)
+            self._conn = conn
+        return self._conn
+
     @contextmanager
     def connection(self) -> Generator[sqlite3.Connection, None, None]:
-        """Get a database connection context manager."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        """Get a transaction scope on the shared database connection.
 
-    def initialize(self) -> None:
-        """Initialize the database schema."""
-        with self.connection() as conn:
-            cursor = conn.cursor()
+        The connection is opened lazily and kept for the lifetime of the
+        Database. Nested scopes join the enclosing transaction.
+        """
+        with self._lock:
+            conn = self._get_connection()
+            if conn.in_transaction:
+                yield conn
+                return
+
+            conn.execute("BEGIN")
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
 
-            # Create sessions table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS sessions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT,
-                    start_time TEXT NOT NULL,
-                    end_time TEXT,
-                    target_id INTEGER,
-                    reading_count INTEGER DEFAULT 0,
-                    avg_median_pitch REAL DEFAULT 0.0,
-                    avg_voicing_rate REAL DEFAULT 0.0,
-                    notes TEXT,
-                    FOREIGN KEY (target_id) REFERENCES targets(id)
-                )
-            """)
+    @contextmanager
+    def _foreign_keys_disabled(self) -> Generator[None, None, None]:
+        """Turn off foreign key enforcement for the duration of the block.
 
-            # Create readings table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS readings (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    session_id INTEGER NOT NULL,
-                    timestamp TEXT NOT NULL,
-                    median_pitch REAL DEFAULT 0.0,
-                    mean_pitch REAL DEFAULT 0.0,
-                    min_pitch REAL DEFAULT 0.0,
-                    max_pitch REAL DEFAULT 0.0,
-                    std_pitch REAL DEFAULT 0.0,
-                    voiced_frames INTEGER DEFAULT 0,
-                    total_frames INTEGER DEFAULT 0,
-                    voicing_rate REAL DEFAULT 0.0,
-                    f1_mean REAL DEFAULT 0.0,
-                    f2_mean REAL DEFAULT 0.0,
-                    f3_mean REAL DEFAULT 0.0,
-                    f1_std REAL DEFAULT 0.0,
-                    f2_std REAL DEFAULT 0.0,
-                    f3_std REAL DEFAULT 0.0,
-                    clip_path TEXT,
-                    duration_seconds REAL DEFAULT 0.0,
-                    device_id INTEGER,
-                    FOREIGN KEY (session_id) REFERENCES sessions(id)
-                )
-            """)
+        Table rebuilds must not fire cascades or FK checks, and the pragma is
+        ignored inside a transaction, so it is toggled around the whole scope.
+        """
+        with self._lock:
+            conn = self._get_connection()
+            conn.execute("PRAGMA foreign_keys=OFF")
+            try:
+                yield
+            finally:
+                conn.execute("PRAGMA foreign_keys=ON")
+
+    def close(self) -> None:
+        """Close the shared database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _configure_connection(self, conn: sqlite3.Connection) -> None:
+        """Apply performance PRAGMAs to a newly opened connection.
 
-            # Create targets table
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS targets (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    name TEXT NOT NULL DEFAULT 'Default',
-                    created_at TEXT NOT NULL,
-                    min_pitch REAL NOT NULL DEFAULT 80.0,
-                    max_pitch REAL NOT NULL DEFAULT 250.0,
-                    voice_type TEXT,
-                    target_f2 REAL,
-                    is_active INTEGER DEFAULT 1
-                )
-            """)
+        Args:
+            conn: Connection to configure.
+        """
+        path = str(self.db_path)
+        if path != ":memory:" and path not in self._wal_enabled:
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._wal_enabled.add(path)
+
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA busy_timeout=3000")
+        conn.execute("PRAGMA foreign_keys=ON")
 
-            # Create metadata table for schema version
+    def initialize(self) -> None:
+        """Initialize the database schema, migrating older versions in place."""
+        with self._foreign_keys_disabled(), self.connection() as conn:
+            cursor = conn.cursor()
+
+            # Create metadata table for other persistent keys
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS metadata (
                     key TEXT PRIMARY KEY,
@@ -129,11 +361,42 @@ class Database:
                 )
             """)
 
-            # Set schema version
+            # The schema version lives in the header; databases written before
+            # that still carry it in the metadata table.
+            cursor.execute("PRAGMA user_version")
+            version = cursor.fetchone()[0]
+            if version == 0:
+                cursor.execute("SELECT value FROM metadata WHERE key = ?", ('schema_version',))
+                row = cursor.fetchone()
+                version = int(row[0]) if row is not None else 0
+            if 0 < version < self.SCHEMA_VERSION:
+                self._migrate(conn, version)
+
+            cursor.execute(_SESSIONS_TABLE.format(table="sessions"))
+            cursor.execute(_READINGS_TABLE.format(table="readings"))
+            cursor.execute(_TARGETS_TABLE.format(table="targets"))
+
+            # Indexes for the hot read paths
             cursor.execute(
-                "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
-                ('schema_version', str(self.SCHEMA_VERSION))
+                "CREATE INDEX IF NOT EXISTS idx_readings_session_ts"
+                " ON readings(session_id, timestamp)"
             )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_readings_timestamp"
+                " ON readings(timestamp DESC)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_sessions_target_start"
+                " ON sessions(target_id, start_time DESC)"
+            )
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_targets_active"
+                " ON targets(is_active, created_at DESC)"
+            )
+
+            # Set schema version
+            cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+            cursor.execute("DELETE FROM metadata WHERE key = ?", ('schema_version',))
 
             # Create default target if none exists
             cursor.execute("SELECT COUNT(*) FROM targets")
@@ -141,7 +404,44 @@ class Database:
                 cursor.execute("""
                     INSERT INTO targets (name, created_at, min_pitch, max_pitch, is_active)
                     VALUES (?, ?, ?, ?, ?)
-                """, ('Default', datetime.now().isoformat(), 80.0, 250.0, 1))
+                """, ('Default', _to_epoch_us(datetime.now()), 80.0, 250.0, 1))
+
+    def _migrate(self, conn: sqlite3.Connection, from_version: int) -> None:
+        """Upgrade the schema one version at a time up to SCHEMA_VERSION.
+
+        Args:
+            conn: Connection with an open transaction.
+            from_version: Schema version currently stored in the database.
+        """
+        migrations = {
+            1: self._migrate_v1_to_v2,
+            2: self._migrate_v2_to_v3,
+        }
+        for version in range(from_version, self.SCHEMA_VERSION):
+            migrations[version](conn)
+
+    def _migrate_v1_to_v2(self, conn: sqlite3.Connection) -> None:
+        """Convert ISO-8601 TEXT timestamps to INTEGER epoch microseconds.
+
+        Column affinity cannot be altered in place, so each table is rebuilt
+        and its rows copied across through the conversion function.
+        """
+        conn.create_function(
+            "iso_to_epoch_us",
+            1,
+            lambda value: _to_epoch_us(datetime.fromisoformat(value)) if value else None,
+            deterministic=True,
+        )
+        _rebuild_table(conn, "sessions", _SESSIONS_TABLE, _SESSION_COLUMNS,
+                       _SESSION_TIME_COLUMNS)
+        _rebuild_table(conn, "readings", _READINGS_TABLE, _READING_COLUMNS,
+                       _READING_TIME_COLUMNS)
+        _rebuild_table(conn, "targets", _TARGETS_TABLE, _TARGET_COLUMNS,
+                       _TARGET_TIME_COLUMNS)
+
+    def _migrate_v2_to_v3(self, conn: sqlite3.Connection) -> None:
+        """Rebuild readings so its session foreign key cascades on delete."""
+        _rebuild_table(conn, "readings", _READINGS_TABLE, _READING_COLUMNS)
 
     def check_schema(self) -> bool:
         """Check if the database schema is valid.
@@ -152,11 +452,9 @@ class Database:
         try:
             with self.connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("SELECT value FROM metadata WHERE key = ?", ('schema_version',))
+                cursor.execute("PRAGMA user_version")
                 row = cursor.fetchone()
-                if row is None:
-                    return False
-                return int(row[0]) == self.SCHEMA_VERSION
+                return row is not None and bool(row[0] == self.SCHEMA_VERSION)
         except sqlite3.OperationalError:
             return False
 
@@ -178,7 +476,7 @@ class Database:
                 VALUES (?, ?, ?, ?)
             """, (
                 session.name,
-                session.start_time.isoformat(),
+                _to_epoch_us(session.start_time),
                 session.target_id,
                 session.notes
             ))
@@ -195,21 +493,11 @@ class Database:
         """
         with self.connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM sessions WHERE id = ?", (session_id,))
+            cursor.execute(f"SELECT {_SESSION_SELECT} FROM sessions WHERE id = ?", (session_id,))
             row = cursor.fetchone()
             if row is None:
                 return None
-            return Session(
-                id=row['id'],
-                name=row['name'],
-                start_time=datetime.fromisoformat(row['start_time']),
-                end_time=datetime.fromisoformat(row['end_time']) if row['end_time'] else None,
-                target_id=row['target_id'],
-                reading_count=row['reading_count'],
-                avg_median_pitch=row['avg_median_pitch'],
-                avg_voicing_rate=row['avg_voicing_rate'],
-                notes=row['notes'],
-            )
+            return _row_to_session(row)
 
     def update_session(self, session: Session) -> None:
         """Update an existing session.
@@ -231,7 +519,7 @@ class Database:
                 WHERE id = ?
             """, (
                 session.name,
-                session.end_time.isoformat() if session.end_time else None,
+                _to_epoch_us(session.end_time) if session.end_time is not None else None,
                 session.target_id,
                 session.reading_count,
                 session.avg_median_pitch,
@@ -258,29 +546,11 @@ class Database:
         """
         with self.connection() as conn:
             cursor = conn.cursor()
-            query = "SELECT * FROM sessions"
-            params = []
             if target_id is not None:
-                query += " WHERE target_id = ?"
-                params.append(target_id)
-            query += " ORDER BY start_time DESC LIMIT ? OFFSET ?"
-            params.extend([limit, offset])
-
-            cursor.execute(query, params)
-            return [
-                Session(
-                    id=row['id'],
-                    name=row['name'],
-                    start_time=datetime.fromisoformat(row['start_time']),
-                    end_time=datetime.fromisoformat(row['end_time']) if row['end_time'] else None,
-                    target_id=row['target_id'],
-                    reading_count=row['reading_count'],
-                    avg_median_pitch=row['avg_median_pitch'],
-                    avg_voicing_rate=row['avg_voicing_rate'],
-                    notes=row['notes'],
-                )
-                for row in cursor.fetchall()
-            ]
+                cursor.execute(_LIST_SESSIONS_BY_TARGET_SQL, (target_id, limit, offset))
+            else:
+                cursor.execute(_LIST_SESSIONS_SQL, (limit, offset))
+            return [_row_to_session(row) for row in cursor.fetchall()]
 
     def get_recent_sessions(self, count: int = 10) -> List[Session]:
         """Get the most recent sessions.
@@ -304,37 +574,52 @@ class Database:
         Returns:
             ID of the newly created reading.
         """
+        return self.create_readings([reading])[0]
+
+    def create_readings(self, readings: List[Reading]) -> List[int]:
+        """Create several readings in a single transaction.
+
+        Args:
+            readings: Reading objects to create.
+
+        Returns:
+            IDs of the newly created readings, in input order.
+        """
+        if not readings:
+            return []
+
+        rows = [
+            (
+                r.session_id,
+                _to_epoch_us(r.timestamp),
+                r.median_pitch,
+                r.mean_pitch,
+                r.min_pitch,
+                r.max_pitch,
+                r.std_pitch,
+                r.voiced_frames,
+                r.total_frames,
+                r.voicing_rate,
+                r.f1_mean,
+                r.f2_mean,
+                r.f3_mean,
+                r.f1_std,
+                r.f2_std,
+                r.f3_std,
+                r.clip_path,
+                r.duration_seconds,
+                r.device_id,
+            )
+            for r in readings
+        ]
+
         with self.connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO readings (
-                    session_id, timestamp, median_pitch, mean_pitch, min_pitch,
-                    max_pitch, std_pitch, voiced_frames, total_frames, voicing_rate,
-                    f1_mean, f2_mean, f3_mean, f1_std, f2_std, f3_std,
-                    clip_path, duration_seconds, device_id
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                reading.session_id,
-                reading.timestamp.isoformat(),
-                reading.median_pitch,
-                reading.mean_pitch,
-                reading.min_pitch,
-                reading.max_pitch,
-                reading.std_pitch,
-                reading.voiced_frames,
-                reading.total_frames,
-                reading.voicing_rate,
-                reading.f1_mean,
-                reading.f2_mean,
-                reading.f3_mean,
-                reading.f1_std,
-                reading.f2_std,
-                reading.f3_std,
-                reading.clip_path,
-                reading.duration_seconds,
-                reading.device_id
-            ))
-            return cursor.lastrowid
+            cursor.executemany(_INSERT_READING_SQL, rows)
+            # Rowids assigned within one transaction are contiguous
+            cursor.execute("SELECT last_insert_rowid()")
+            last_id = cursor.fetchone()[0]
+            return list(range(last_id - len(rows) + 1, last_id + 1))
 
     def get_reading(self, reading_id: int) -> Optional[Reading]:
         """Get a reading by ID.
@@ -347,36 +632,19 @@ class Database:
         """
         with self.connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM readings WHERE id = ?", (reading_id,))
+            cursor.execute(f"SELECT {_READING_SELECT} FROM readings WHERE id = ?", (reading_id,))
             row = cursor.fetchone()
             if row is None:
                 return None
-            return Reading(
-                id=row['id'],
-                session_id=row['session_id'],
-                timestamp=datetime.fromisoformat(row['timestamp']),
-                median_pitch=row['median_pitch'],
-                mean_pitch=row['mean_pitch'],
-                min_pitch=row['min_pitch'],
-                max_pitch=row['max_pitch'],
-                std_pitch=row['std_pitch'],
-                voiced_frames=row['voiced_frames'],
-                total_frames=row['total_frames'],
-                voicing_rate=row['voicing_rate'],
-                f1_mean=row['f1_mean'],
-                f2_mean=row['f2_mean'],
-                f3_mean=row['f3_mean'],
-                f1_std=row['f1_std'],
-                f2_std=row['f2_std'],
-                f3_std=row['f3_std'],
-                clip_path=row['clip_path'],
-                duration_seconds=row['duration_seconds'],
-                device_id=row['device_id'],
-            )
+            return _row_to_reading(row)
 
     def get_readings_for_session(self, session_id: int) -> List[Reading]:
         """Get all readings for a session.
 
+        Reads them with a single query rather than through
+        iter_readings_for_session(), so the list is one consistent snapshot
+        even if readings are written while it is being built.
+
         Args:
             session_id: ID of the session.
 
@@ -386,34 +654,39 @@ class Database:
         with self.connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT * FROM readings WHERE session_id = ? ORDER BY timestamp",
+                f"SELECT {_READING_SELECT} FROM readings WHERE session_id = ?"
+                " ORDER BY timestamp, id",
                 (session_id,)
             )
-            return [
-                Reading(
-                    id=row['id'],
-                    session_id=row['session_id'],
-                    timestamp=datetime.fromisoformat(row['timestamp']),
-                    median_pitch=row['median_pitch'],
-                    mean_pitch=row['mean_pitch'],
-                    min_pitch=row['min_pitch'],
-                    max_pitch=row['max_pitch'],
-                    std_pitch=row['std_pitch'],
-                    voiced_frames=row['voiced_frames'],
-                    total_frames=row['total_frames'],
-                    voicing_rate=row['voicing_rate'],
-                    f1_mean=row['f1_mean'],
-                    f2_mean=row['f2_mean'],
-                    f3_mean=row['f3_mean'],
-                    f1_std=row['f1_std'],
-                    f2_std=row['f2_std'],
-                    f3_std=row['f3_std'],
-                    clip_path=row['clip_path'],
-                    duration_seconds=row['duration_seconds'],
-                    device_id=row['device_id'],
-                )
-                for row in cursor.fetchall()
-            ]
+            return [_row_to_reading(row) for row in cursor.fetchall()]
+
+    def iter_readings_for_session(self, session_id: int) -> Iterator[Reading]:
+        """Iterate over the readings for a session without loading them all.
+
+        Rows are fetched in batches, each in its own short read with no
+        transaction open, so the lock is free between batches and writes
+        made while iterating are committed normally.
+
+        Args:
+            session_id: ID of the session.
+
+        Yields:
+            Reading objects in timestamp order.
+        """
+        # Keyset pagination on (timestamp, id); the raw timestamp is
+        # selected last so the next batch can resume after it
+        last_ts, last_id = -(2**63), -1
+        while True:
+            with self._lock:
+                conn = self._get_connection()
+                batch = conn.execute(_ITER_READINGS_SQL, (
+                    session_id, last_ts, last_id, _FETCH_BATCH_SIZE
+                )).fetchall()
+            if not batch:
+                return
+            for row in batch:
+                yield _row_to_reading(row[:-1])
+            last_ts, last_id = batch[-1][-1], batch[-1][0]
 
     def get_recent_readings(self, count: int = 100) -> List[Reading]:
         """Get the most recent readings across all sessions.
@@ -427,34 +700,10 @@ class Database:
         with self.connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT * FROM readings ORDER BY timestamp DESC LIMIT ?",
+                f"SELECT {_READING_SELECT} FROM readings ORDER BY timestamp DESC LIMIT ?",
                 (count,)
             )
-            return [
-                Reading(
-                    id=row['id'],
-                    session_id=row['session_id'],
-                    timestamp=datetime.fromisoformat(row['timestamp']),
-                    median_pitch=row['median_pitch'],
-                    mean_pitch=row['mean_pitch'],
-                    min_pitch=row['min_pitch'],
-                    max_pitch=row['max_pitch'],
-                    std_pitch=row['std_pitch'],
-                    voiced_frames=row['voiced_frames'],
-                    total_frames=row['total_frames'],
-                    voicing_rate=row['voicing_rate'],
-                    f1_mean=row['f1_mean'],
-                    f2_mean=row['f2_mean'],
-                    f3_mean=row['f3_mean'],
-                    f1_std=row['f1_std'],
-                    f2_std=row['f2_std'],
-                    f3_std=row['f3_std'],
-                    clip_path=row['clip_path'],
-                    duration_seconds=row['duration_seconds'],
-                    device_id=row['device_id'],
-                )
-                for row in cursor.fetchall()
-            ]
+            return [_row_to_reading(row) for row in cursor.fetchall()]
 
     # Target operations
 
@@ -474,7 +723,7 @@ class Database:
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             """, (
                 target.name,
-                target.created_at.isoformat(),
+                _to_epoch_us(target.created_at),
                 target.min_pitch,
                 target.max_pitch,
                 target.voice_type,
@@ -494,20 +743,11 @@ class Database:
         """
         with self.connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM targets WHERE id = ?", (target_id,))
+            cursor.execute(f"SELECT {_TARGET_SELECT} FROM targets WHERE id = ?", (target_id,))
             row = cursor.fetchone()
             if row is None:
                 return None
-            return Target(
-                id=row['id'],
-                name=row['name'],
-                created_at=datetime.fromisoformat(row['created_at']),
-                min_pitch=row['min_pitch'],
-                max_pitch=row['max_pitch'],
-                voice_type=row['voice_type'],
-                target_f2=row['target_f2'],
-                is_active=bool(row['is_active']),
-            )
+            return _row_to_target(row)
 
     def get_active_target(self) -> Optional[Target]:
         """Get the currently active target.
@@ -517,20 +757,14 @@ class Database:
         """
         with self.connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM targets WHERE is_active = 1 ORDER BY created_at DESC LIMIT 1")
+            cursor.execute(
+                f"SELECT {_TARGET_SELECT} FROM targets"
+                " WHERE is_active = 1 ORDER BY created_at DESC LIMIT 1"
+            )
             row = cursor.fetchone()
             if row is None:
                 return None
-            return Target(
-                id=row['id'],
-                name=row['name'],
-                created_at=datetime.fromisoformat(row['created_at']),
-                min_pitch=row['min_pitch'],
-                max_pitch=row['max_pitch'],
-                voice_type=row['voice_type'],
-                target_f2=row['target_f2'],
-                is_active=bool(row['is_active']),
-            )
+            return _row_to_target(row)
 
     def list_targets(self) -> List[Target]:
         """List all targets.
@@ -540,20 +774,8 @@ class Database:
         """
         with self.connection() as conn:
             cursor = conn.cursor()
-            cursor.execute("SELECT * FROM targets ORDER BY created_at DESC")
-            return [
-                Target(
-                    id=row['id'],
-                    name=row['name'],
-                    created_at=datetime.fromisoformat(row['created_at']),
-                    min_pitch=row['min_pitch'],
-                    max_pitch=row['max_pitch'],
-                    voice_type=row['voice_type'],
-                    target_f2=row['target_f2'],
-                    is_active=bool(row['is_active']),
-                )
-                for row in cursor.fetchall()
-            ]
+            cursor.execute(f"SELECT {_TARGET_SELECT} FROM targets ORDER BY created_at DESC")
+            return [_row_to_target(row) for row in cursor.fetchall()]
 
     def set_active_target(self, target_id: int) -> None:
         """Set a target as active, deactivating others.
@@ -581,40 +803,30 @@ class Database:
         with self.connection() as conn:
             cursor = conn.cursor()
 
-            # Get reading count
-            cursor.execute("SELECT COUNT(*) FROM readings WHERE session_id = ?", (session_id,))
-            total_readings = cursor.fetchone()[0]
-
-            if total_readings == 0:
-                return SessionSummary(session_id=session_id)
+            # Without a usable target the bounds are NULL and nothing counts as in range
+            bounds: Tuple[Optional[float], Optional[float]]
+            if target and target.min_pitch > 0:
+                bounds = (target.min_pitch, target.max_pitch)
+            else:
+                bounds = (None, None)
 
-            # Get pitch statistics
             cursor.execute("""
                 SELECT
-                    AVG(median_pitch) as avg_pitch,
-                    MIN(median_pitch) as min_pitch,
-                    MAX(median_pitch) as max_pitch,
-                    AVG(std_pitch) as avg_std,
-                    AVG(voicing_rate) as avg_voicing
+                    COUNT(*),
+                    AVG(median_pitch),
+                    MIN(median_pitch),
+                    MAX(median_pitch),
+                    AVG(std_pitch),
+                    AVG(voicing_rate),
+                    SUM(CASE WHEN median_pitch >= ? AND median_pitch <= ? THEN 1 ELSE 0 END)
                 FROM readings
                 WHERE session_id = ?
-            """, (session_id,))
-            row = cursor.fetchone()
-
-            avg_pitch = row['avg_pitch'] or 0.0
-            min_pitch = row['min_pitch'] or 0.0
-            max_pitch = row['max_pitch'] or 0.0
-            pitch_std = row['avg_std'] or 0.0
-            avg_voicing = row['avg_voicing'] or 0.0
+            """, (*bounds, session_id))
+            (total_readings, avg_pitch, min_pitch, max_pitch,
+             pitch_std, avg_voicing, readings_in_range) = cursor.fetchone()
 
-            # Count readings in range if target provided
-            readings_in_range = 0
-            if target and target.min_pitch > 0:
-                cursor.execute("""
-                    SELECT COUNT(*) FROM readings
-                    WHERE session_id = ? AND median_pitch >= ? AND median_pitch <= ?
-                """, (session_id, target.min_pitch, target.max_pitch))
-                readings_in_range = cursor.fetchone()[0]
+            if total_readings == 0:
+                return SessionSummary(session_id=session_id)
 
             in_range_pct = (readings_in_range / total_readings * 100) if total_readings > 0 else 0.0
 
@@ -623,11 +835,11 @@ class Database:
                 total_readings=total_readings,
                 readings_in_range=readings_in_range,
                 readings_out_of_range=total_readings - readings_in_range,
-                avg_median_pitch=avg_pitch,
-                min_median_pitch=min_pitch,
-                max_median_pitch=max_pitch,
-                pitch_std=pitch_std,
-                avg_voicing_rate=avg_voicing,
+                avg_median_pitch=avg_pitch or 0.0,
+                min_median_pitch=min_pitch or 0.0,
+                max_median_pitch=max_pitch or 0.0,
+                pitch_std=pitch_std or 0.0,
+                avg_voicing_rate=avg_voicing or 0.0,
                 in_range_percentage=in_range_pct,
             )
 
@@ -647,22 +859,11 @@ class Database:
         """
         with self.connection() as conn:
             cursor = conn.cursor()
-            query = """
-                SELECT date(timestamp) as date, AVG(median_pitch) as avg_pitch
-                FROM readings
-                WHERE timestamp >= datetime('now', ?)
-            """
-            params = [f'-{days} days']
-
+            since = _to_epoch_us(datetime.now() - timedelta(days=days))
             if target_id is not None:
-                query += """ AND session_id IN (
-                    SELECT id FROM sessions WHERE target_id = ?
-                )"""
-                params.append(target_id)
-
-            query += " GROUP BY date(timestamp) ORDER BY date"
-
-            cursor.execute(query, params)
+                cursor.execute(_TREND_BY_TARGET_SQL, (since, target_id))
+            else:
+                cursor.execute(_TREND_SQL, (since,))
             return [
                 (datetime.fromisoformat(row['date']), row['avg_pitch'] or 0.0)
                 for row in cursor.fetchall()
@@ -679,9 +880,7 @@ class Database:
         """
         with self.connection() as conn:
             cursor = conn.cursor()
-            # Delete readings first
-            cursor.execute("DELETE FROM readings WHERE session_id = ?", (session_id,))
-            # Then delete session
+            # Readings go with it via ON DELETE CASCADE
             cursor.execute("DELETE FROM sessions WHERE id = ?", (session_id,))
             return cursor.rowcount > 0
 
@@ -694,27 +893,70 @@ class Database:
         Returns:
             Updated Session object or None if not found.
         """
-        session = self.get_session(session_id)
-        if session is None:
-            return None
+        with self.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                UPDATE sessions SET
+                    end_time = ?,
+                    (reading_count, avg_median_pitch, avg_voicing_rate) = (
+                        SELECT COUNT(*),
+                               COALESCE(AVG(median_pitch), 0.0),
+                               COALESCE(AVG(voicing_rate), 0.0)
+                        FROM readings
+                        WHERE session_id = sessions.id
+                    )
+                WHERE id = ?
+            """, (_to_epoch_us(datetime.now()), session_id))
+            if cursor.rowcount == 0:
+                return None
+            session = self.get_session(session_id)
 
-        session.end_time = datetime.now()
-        readings = self.get_readings_for_session(session_id)
+        self.maintenance()
+        return session
 
-        if readings:
-            session.reading_count = len(readings)
-            session.avg_median_pitch = sum(r.median_pitch for r in readings) / len(readings)
-            session.avg_voicing_rate = sum(r.voicing_rate for r in readings) / len(readings)
+    def maintenance(self) -> None:
+        """Refresh query planner statistics with ``PRAGMA optimize``.
+
+        Runs at most once per ``_OPTIMIZE_INTERVAL``; the time of the last run
+        is kept in the metadata table. Does nothing on an uninitialized
+        database.
+        """
+        now = datetime.now()
+        try:
+            with self.connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute("SELECT value FROM metadata WHERE key = ?", ('last_optimize',))
+                row = cursor.fetchone()
+                if row is not None and now - datetime.fromisoformat(row[0]) < _OPTIMIZE_INTERVAL:
+                    return
+                cursor.execute("PRAGMA optimize")
+                cursor.execute(
+                    "INSERT OR REPLACE INTO metadata (key, value) VALUES (?, ?)",
+                    ('last_optimize', now.isoformat())
+                )
+        except sqlite3.OperationalError:
+            pass
 
-        self.update_session(session)
-        return session
+
+# Default Database per path, so repeated lookups share one connection
+_default_dbs: Dict[Path, Database] = {}
+_default_dbs_lock = threading.Lock()
 
 
 def get_default_db() -> Database:
     """Get the default database instance.
 
+    The instance is created once per process (per home directory) and runs
+    maintenance() on creation; later calls return it without touching the
+    database.
+
     Returns:
         Database instance pointing to ~/.fern/fern.db
     """
     db_path = Path.home() / ".fern" / "fern.db"
-    return Database(db_path)
+    with _default_dbs_lock:
+        db = _default_dbs.get(db_path)
+        if db is None:
+            db = _default_dbs[db_path] = Database(db_path)
+            db.maintenance()
+    return db
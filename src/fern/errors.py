@@ -21,12 +21,27 @@ Categories:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum, auto
-from functools import lru_cache
-from typing import Optional, Dict, Any, List
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Sequence, Tuple, Union
+import functools
+import logging
 import sys
 import os
+import traceback
+
+# Interpreter version for the FERN-902 hint; fixed for the life of the process.
+_PY_VERSION_STR = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+
+# Read once at import; FERN_DEBUG is a process-lifetime setting.
+_FERN_DEBUG: bool = bool(os.environ.get("FERN_DEBUG"))
+
+
+def _refresh_debug_flag() -> None:
+    """Re-read FERN_DEBUG from the environment (e.g. after tests change it)."""
+    global _FERN_DEBUG
+    _FERN_DEBUG = bool(os.environ.get("FERN_DEBUG"))
 
 
 class ErrorSeverity(Enum):
@@ -50,6 +65,42 @@ class ErrorCategory(Enum):
     UNKNOWN = "Unknown"
 
 
+class _DeferredDetails:
+    """Technical details still to be taken from a wrapped exception."""
+
+    __slots__ = ("exception", "fallback")
+
+    def __init__(self, exception: BaseException, fallback: str) -> None:
+        self.exception = exception
+        self.fallback = fallback
+
+    def resolve(self) -> str:
+        """Stringify the exception, using the fallback if that is empty."""
+        return str(self.exception) or self.fallback
+
+
+class _TechnicalDetails:
+    """Descriptor behind FernError.technical_details.
+
+    Accepts a string or a _DeferredDetails and always reads back as a
+    string; a deferred value is resolved on first read and cached.
+    """
+
+    def __get__(self, obj: Optional[FernError], objtype: Any = None) -> str:
+        if obj is None:
+            return ""  # Dataclass default
+        value: Union[str, _DeferredDetails] = obj.__dict__["_technical_details"]
+        if isinstance(value, _DeferredDetails):
+            value = obj.__dict__["_technical_details"] = value.resolve()
+        return value
+
+    def __set__(self, obj: FernError, value: Union[str, _DeferredDetails]) -> None:
+        obj.__dict__["_technical_details"] = value
+
+
+# Not slots=True: BaseException instances get a __dict__ even with slots
+# (add_note() keeps __notes__ there), so slots save no memory here, and
+# _TechnicalDetails stores its value in that __dict__.
 @dataclass
 class FernError(Exception):
     """Complete error information."""
@@ -57,13 +108,26 @@ class FernError(Exception):
     message: str
     severity: ErrorSeverity
     category: ErrorCategory
-    technical_details: str = ""
-    suggestions: List[str] = field(default_factory=list)
+    technical_details: _TechnicalDetails = _TechnicalDetails()
+    suggestions: Tuple[str, ...] = ()
     original_exception: Optional[Exception] = None
     context: Dict[str, Any] = field(default_factory=dict)
+    _rendered: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    numeric_code: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the exit code from the FERN-XXX code."""
+        parts = self.code.split("-")
+        if len(parts) > 1 and parts[1].isdecimal():
+            self.numeric_code = min(int(parts[1]), 125)  # Max exit code is 125
+        else:
+            self.numeric_code = 1
 
     def __str__(self) -> str:
-        """Format error for display."""
+        """Format error for display, rendering it only once."""
+        if self._rendered is not None:
+            return self._rendered
+
         lines = [
             f"[bold red]🌿 Error {self.code}[/bold red]",
             f"[yellow]{self.message}[/yellow]",
@@ -75,16 +139,23 @@ class FernError(Exception):
             for suggestion in self.suggestions:
                 lines.append(f"  • {suggestion}")
 
-        if self.technical_details and os.getenv("FERN_DEBUG"):
+        details = self.technical_details if _FERN_DEBUG else ""
+        if details:
             lines.append("")
             lines.append("[dim]Technical Details:[/dim]")
-            lines.append(f"  {self.technical_details}")
+            lines.append(f"  {details}")
 
-        return "\n".join(lines)
+        rendered = "\n".join(lines)
+        self._rendered = rendered
+        return rendered
 
 
-# Cache for error registry
+# Cache for error registry, filled from _ERROR_SPECS on first lookup
 _error_registry: Dict[str, FernError] = {}
+_error_registry_view: Mapping[str, FernError] = MappingProxyType(_error_registry)
+
+# Canonical suggestion tuples, so errors with the same suggestions share one
+_suggestion_tuples: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
 
 
 def register_error(error: FernError) -> None:
@@ -93,667 +164,659 @@ def register_error(error: FernError) -> None:
 
 
 def get_error(code: str) -> Optional[FernError]:
-    """Get an error by its code."""
-    return _error_registry.get(code)
+    """Get an error by its code, building it from its spec on first use."""
+    error = _error_registry.get(code)
+    if error is None:
+        spec = _ERROR_SPECS.get(code)
+        if spec is None:
+            return None
+        message, severity, category, technical_details, suggestions = spec
+        suggestions = tuple(sys.intern(suggestion) for suggestion in suggestions)
+        suggestions = _suggestion_tuples.setdefault(suggestions, suggestions)
+        error = FernError(
+            code=code,
+            message=sys.intern(message),
+            severity=ErrorSeverity[severity],
+            category=ErrorCategory[category],
+            technical_details=sys.intern(technical_details),
+            suggestions=suggestions,
+        )
+        _error_registry[code] = error
+    return error
+
 
+def get_all_errors() -> Mapping[str, FernError]:
+    """Get a read-only live view of all registered errors.
 
-def get_all_errors() -> Dict[str, FernError]:
-    """Get all registered errors."""
-    return _error_registry.copy()
+    Use ``dict(get_all_errors())`` if a mutable snapshot is needed.
+    """
+    for code in _ERROR_SPECS:
+        get_error(code)
+    return _error_registry_view
 
 
 # =============================================================================
 # ERROR DEFINITIONS
 # =============================================================================
 
-# -----------------------------------------------------------------------------
-# Core/General Errors (000-099)
-# -----------------------------------------------------------------------------
-
-register_error(FernError(
-    code="FERN-000",
-    message="An unknown error occurred",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.CORE,
-    technical_details="No specific error information available",
-    suggestions=[
-        "Run with FERN_DEBUG=1 for more details",
-        "Check the logs in ~/.fern/fern.log",
-        "Report this issue at https://github.com/autumnsgrove/fern/issues"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-001",
-    message="Fern is not initialized properly",
-    severity=ErrorSeverity.FATAL,
-    category=ErrorCategory.CORE,
-    technical_details="Core initialization failed",
-    suggestions=[
-        "Try reinstalling Fern: uv pip install -e .",
-        "Check that all dependencies are installed: uv sync",
-        "Verify Python version is 3.11+: python3 --version"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-002",
-    message="Interrupted by user",
-    severity=ErrorSeverity.INFO,
-    category=ErrorCategory.CORE,
-    technical_details="User sent interrupt signal (Ctrl+C)",
-    suggestions=[
-        "This is normal behavior when canceling an operation",
-        "Your data has been saved up to this point"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-003",
-    message="File permission denied",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.CORE,
-    technical_details="Cannot read or write required file",
-    suggestions=[
-        "Check file permissions: ls -la <path>",
-        "Ensure you have write access to the directory",
-        "Try running with sudo (not recommended for regular use)"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-004",
-    message="Path does not exist",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.CORE,
-    technical_details="Required file or directory path is missing",
-    suggestions=[
-        "Verify the path is correct",
-        "Create the required directory: mkdir -p <path>",
-        "Run fern status to check your configuration"
-    ]
-))
-
-# -----------------------------------------------------------------------------
-# Audio/Capture Errors (100-199)
-# -----------------------------------------------------------------------------
-
-register_error(FernError(
-    code="FERN-100",
-    message="No microphone found",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.AUDIO,
-    technical_details="sounddevice could not find any audio input device",
-    suggestions=[
-        "Check System Settings → Privacy → Microphone",
-        "Connect a microphone if none is attached",
-        "Try specifying a device: fern test --device 0",
-        "List available devices: fern test --list-devices"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-101",
-    message="Microphone access denied",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.AUDIO,
-    technical_details="macOS denied microphone access to Fern",
-    suggestions=[
-        "Open System Settings → Privacy & Security → Microphone",
-        "Enable access for Terminal (or your terminal emulator)",
-        "Restart Fern after granting permissions"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-102",
-    message="Audio device is already in use",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.AUDIO,
-    technical_details="The requested audio device is busy with another application",
-    suggestions=[
-        "Close other applications that might be using the microphone",
-        "Select a different device: fern test --device <index>",
-        "Wait for the other application to release the device"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-103",
-    message="Audio capture failed unexpectedly",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.AUDIO,
-    technical_details="sounddevice raised an unexpected exception during capture",
-    suggestions=[
-        "Try closing and reopening Fern",
-        "Restart your computer if the issue persists",
-        "Check System Settings → Sound → Input for device health"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-104",
-    message="Invalid audio sample rate",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.AUDIO,
-    technical_details="Requested sample rate not supported by device",
-    suggestions=[
-        "Use the default sample rate: fern test",
-        "Check supported rates: fern test --list-devices",
-        "Your device may not support the requested rate"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-105",
-    message="Audio buffer overflow",
-    severity=ErrorSeverity.WARNING,
-    category=ErrorCategory.AUDIO,
-    technical_details="Audio data was lost due to buffer overflow",
-    suggestions=[
-        "This may happen with slow computers or high CPU load",
-        "Try reducing other system activity during capture",
-        "Consider increasing buffer size in config"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-106",
-    message="No audio input detected",
-    severity=ErrorSeverity.WARNING,
-    category=ErrorCategory.AUDIO,
-    technical_details="Microphone is recording but no voice detected",
-    suggestions=[
-        "Check your microphone is not muted",
-        "Speak louder or move closer to the microphone",
-        "Verify the input level in System Settings → Sound"
-    ]
-))
-
-# -----------------------------------------------------------------------------
-# Analysis Errors (200-299)
-# -----------------------------------------------------------------------------
-
-register_error(FernError(
-    code="FERN-200",
-    message="Praat-parselmouth initialization failed",
-    severity=ErrorSeverity.FATAL,
-    category=ErrorCategory.ANALYSIS,
-    technical_details="Could not load praat-parselmouth library",
-    suggestions=[
-        "Reinstall parselmouth: uv pip install praat-parselmouth",
-        "Ensure you have a compatible Praon installation",
-        "Check Python architecture matches (arm64 vs x86_64)"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-201",
-    message="No pitch detected in audio",
-    severity=ErrorSeverity.WARNING,
-    category=ErrorCategory.ANALYSIS,
-    technical_details="Pitch analysis found no voiced segments",
-    suggestions=[
-        "Ensure you're speaking during capture",
-        "Check microphone input level",
-        "Try adjusting the pitch range in config",
-        "This is normal for silence or non-voiced sounds"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-202",
-    message="Pitch detection out of range",
-    severity=ErrorSeverity.WARNING,
-    category=ErrorCategory.ANALYSIS,
-    technical_details="Detected pitch is outside expected range",
-    suggestions=[
-        "Your pitch may be naturally higher or lower than typical",
-        "Adjust target range: fern config:set-target <min> <max>",
-        "This is not necessarily a problem - pitch varies naturally"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-203",
-    message="Resonance analysis failed",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.ANALYSIS,
-    technical_details="librosa could not extract formants",
-    suggestions=[
-        "Try capturing audio again with clearer speech",
-        "Reduce background noise",
-        "Ensure sufficient audio quality"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-204",
-    message="Audio file is corrupted or invalid",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.ANALYSIS,
-    technical_details="Could not decode audio data",
-    suggestions=[
-        "Try capturing fresh audio",
-        "Check the audio file is not damaged",
-        "Ensure audio is in a supported format (WAV recommended)"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-205",
-    message="Audio too short for analysis",
-    severity=ErrorSeverity.WARNING,
-    category=ErrorCategory.ANALYSIS,
-    technical_details="Audio clip is shorter than minimum required duration",
-    suggestions=[
-        "Capture longer audio segments",
-        "Try the default 5-second capture duration",
-        "Short clips may not contain enough data for analysis"
-    ]
-))
-
-# -----------------------------------------------------------------------------
-# Database Errors (300-399)
-# -----------------------------------------------------------------------------
-
-register_error(FernError(
-    code="FERN-300",
-    message="Database connection failed",
-    severity=ErrorSeverity.FATAL,
-    category=ErrorCategory.DATABASE,
-    technical_details="Could not connect to SQLite database",
-    suggestions=[
-        "Check database file exists: ls ~/.fern/fern.db",
-        "Try restoring from backup: cp ~/.fern/fern.db.backup ~/.fern/fern.db",
-        "Check file permissions on the database file"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-301",
-    message="Database is corrupted",
-    severity=ErrorSeverity.FATAL,
-    category=ErrorCategory.DATABASE,
-    technical_details="SQLite reported corruption or invalid database",
-    suggestions=[
-        "Restore from backup: cp ~/.fern/fern.db.backup ~/.fern/fern.db",
-        "If no backup exists, the database will be rebuilt (data may be lost)",
-        "Report this issue if it happens repeatedly"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-302",
-    message="Database migration required",
-    severity=ErrorSeverity.WARNING,
-    category=ErrorCategory.DATABASE,
-    technical_details="Database schema version is outdated",
-    suggestions=[
-        "This is normal after Fern updates",
-        "Your data will be preserved during migration",
-        "If migration fails, a backup will be created automatically"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-303",
-    message="Query returned no results",
-    severity=ErrorSeverity.INFO,
-    category=ErrorCategory.DATABASE,
-    technical_details="Database query executed successfully but found no matching data",
-    suggestions=[
-        "This is normal for new installations",
-        "Try capturing some audio first: fern test",
-        "Expand your date range: fern trend --days 30"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-304",
-    message="Database constraint violation",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.DATABASE,
-    technical_details="Insert/update violated database constraints",
-    suggestions=[
-        "This is usually a programming error",
-        "Report this issue at https://github.com/autumnsgrove/fern/issues",
-        "Your data has been preserved"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-305",
-    message="Database disk is full",
-    severity=ErrorSeverity.FATAL,
-    category=ErrorCategory.DATABASE,
-    technical_details="Cannot write to database - disk full",
-    suggestions=[
-        "Free up disk space: df -h",
-        "Delete old audio clips: rm ~/.fern/clips/*.wav",
-        "Consider enabling quarterly archiving"
-    ]
-))
-
-# -----------------------------------------------------------------------------
-# Configuration Errors (400-499)
-# -----------------------------------------------------------------------------
-
-register_error(FernError(
-    code="FERN-400",
-    message="Configuration file not found",
-    severity=ErrorSeverity.WARNING,
-    category=ErrorCategory.CONFIG,
-    technical_details="Could not find config file at expected path",
-    suggestions=[
-        "A new config will be created with defaults",
-        "Set custom path: FERN_CONFIG=/path/to/config fern status",
-        "Default config path: ~/.fern/config.yaml"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-401",
-    message="Configuration file is corrupted",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.CONFIG,
-    technical_details="Could not parse YAML configuration",
-    suggestions=[
-        "Check for syntax errors in the config file",
-        "Restore from backup: cp ~/.fern/config.yaml.backup ~/.fern/config.yaml",
-        "A new default config will be created"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-402",
-    message="Invalid configuration value",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.CONFIG,
-    technical_details="Configuration value is out of valid range",
-    suggestions=[
-        "Check the valid range for this setting",
-        "Run fern config:show to see current values",
-        "Reset to defaults: rm ~/.fern/config.yaml"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-403",
-    message="Target pitch range is invalid",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.CONFIG,
-    technical_details="min_pitch must be less than max_pitch",
-    suggestions=[
-        "Set a valid range: fern config:set-target 80 250",
-        "Minimum pitch should typically be 50-100 Hz",
-        "Maximum pitch should typically be 200-400 Hz"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-404",
-    message="Unknown configuration key",
-    severity=ErrorSeverity.WARNING,
-    category=ErrorCategory.CONFIG,
-    technical_details="Configuration contains unrecognized keys",
-    suggestions=[
-        "This may be from an older Fern version",
-        "Unknown keys are ignored but may indicate configuration drift",
-        "Consider regenerating config: rm ~/.fern/config.yaml"
-    ]
-))
-
-# -----------------------------------------------------------------------------
-# CLI/Command Errors (500-599)
-# -----------------------------------------------------------------------------
-
-register_error(FernError(
-    code="FERN-500",
-    message="Invalid command argument",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.CLI,
-    technical_details="Command received an invalid argument value",
-    suggestions=[
-        "Check the command help: fern <command> --help",
-        "Verify argument types (numbers, paths, etc.)",
-        "See usage examples in README.md"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-501",
-    message="Missing required argument",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.CLI,
-    technical_details="Required command argument was not provided",
-    suggestions=[
-        "Check the command help: fern <command> --help",
-        "Provide all required arguments",
-        "Example: fern review <session-id>"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-502",
-    message="Unknown command",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.CLI,
-    technical_details="Specified command does not exist",
-    suggestions=[
-        "List available commands: fern --help",
-        "Check for typos in the command name",
-        "Some commands may require plugins"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-503",
-    message="Session not found",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.CLI,
-    technical_details="Requested session ID does not exist",
-    suggestions=[
-        "List sessions: fern sessions",
-        "Check the session ID is correct",
-        "Session IDs are shown in fern sessions output"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-504",
-    message="Export format not supported",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.CLI,
-    technical_details="Requested export format is not available",
-    suggestions=[
-        "Supported formats: csv, json",
-        "Try: fern export --format csv",
-        "Check fern export --help for more options"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-505",
-    message="Output file cannot be written",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.CLI,
-    technical_details="Cannot create or write to the specified output file",
-    suggestions=[
-        "Check the file path is valid",
-        "Ensure you have write permission in the target directory",
-        "Try a different output path"
-    ]
-))
-
-# -----------------------------------------------------------------------------
-# WebSocket/IPC Errors (600-699)
-# -----------------------------------------------------------------------------
-
-register_error(FernError(
-    code="FERN-600",
-    message="WebSocket server not running",
-    severity=ErrorSeverity.WARNING,
-    category=ErrorCategory.WEBSOCKET,
-    technical_details="Cannot connect to Fern WebSocket server",
-    suggestions=[
-        "Start the Fern server in the background",
-        "The server may already be running on another port",
-        "Fern will work in polling mode without WebSocket"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-601",
-    message="WebSocket connection refused",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.WEBSOCKET,
-    technical_details="Connection to WebSocket server was refused",
-    suggestions=[
-        "Check the server is running: ps aux | grep fern",
-        "Verify the port is correct (default: 8765)",
-        "Restart the server if necessary"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-602",
-    message="WebSocket protocol error",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.WEBSOCKET,
-    technical_details="Received invalid message from WebSocket",
-    suggestions=[
-        "This may indicate a version mismatch",
-        "Try restarting both Fern and Hammerspoon",
-        "Report this issue if it persists"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-603",
-    message="Signal file communication failed",
-    severity=ErrorSeverity.WARNING,
-    category=ErrorCategory.WEBSOCKET,
-    technical_details="Could not read/write signal files for IPC",
-    suggestions=[
-        "Check /tmp directory permissions",
-        "Ensure no other process is locking the signal files",
-        "Fern will retry automatically"
-    ]
-))
-
-# -----------------------------------------------------------------------------
-# Hammerspoon/GUI Errors (700-799)
-# -----------------------------------------------------------------------------
-
-register_error(FernError(
-    code="FERN-700",
-    message="Hammerspoon not installed",
-    severity=ErrorSeverity.FATAL,
-    category=ErrorCategory.GUI,
-    technical_details="Required Hammerspoon application not found",
-    suggestions=[
-        "Install Hammerspoon: brew install hammerspoon",
-        "Or download from https://www.hammerspoon.org/",
-        "Fern CLI will work without Hammerspoon"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-701",
-    message="Fern Lua module not found",
-    severity=ErrorSeverity.ERROR,
-    category=ErrorCategory.GUI,
-    technical_details="Hammerspoon cannot find Fern Lua files",
-    suggestions=[
-        "Run ./install.sh to set up Hammerspoon",
-        "Or manually: ln -s $(pwd)/hammerspoon ~/.hammerspoon/fern.lua",
-        "Ensure all .lua files are in ~/.hammerspoon/"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-702",
-    message="Hammerspoon overlay failed to display",
-    severity=ErrorSeverity.WARNING,
-    category=ErrorCategory.GUI,
-    technical_details="Could not create or show the overlay canvas",
-    suggestions=[
-        "Try reloading Hammerspoon: Ctrl+Cmd+R",
-        "Check Hammerspoon console for errors (Window → Console)",
-        "Ensure no other overlay is blocking the screen"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-703",
-    message="Chart data not available",
-    severity=ErrorSeverity.INFO,
-    category=ErrorCategory.GUI,
-    technical_details="No chart data has been sent to Hammerspoon",
-    suggestions=[
-        "Run: fern chart --send",
-        "Then toggle chart view: Ctrl+Alt+Shift+C",
-        "Capture some audio first to generate data"
-    ]
-))
-
-# -----------------------------------------------------------------------------
-# Fatal/Recovery Errors (900-999)
-# -----------------------------------------------------------------------------
-
-register_error(FernError(
-    code="FERN-900",
-    message="Critical system error",
-    severity=ErrorSeverity.FATAL,
-    category=ErrorCategory.UNKNOWN,
-    technical_details="A critical error occurred that prevents continued operation",
-    suggestions=[
-        "Check logs at ~/.fern/fern.log",
-        "Try restarting Fern",
-        "If this persists, please report this issue",
-        "Your data has been preserved"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-901",
-    message="Out of memory",
-    severity=ErrorSeverity.FATAL,
-    category=ErrorCategory.UNKNOWN,
-    technical_details="System ran out of available memory",
-    suggestions=[
-        "Close other applications to free memory",
-        "Reduce audio buffer size in configuration",
-        "Consider capturing shorter sessions"
-    ]
-))
-
-register_error(FernError(
-    code="FERN-902",
-    message="Incompatible Python version",
-    severity=ErrorSeverity.FATAL,
-    category=ErrorCategory.UNKNOWN,
-    technical_details="Python version does not meet requirements",
-    suggestions=[
-        "Fern requires Python 3.11 or later",
-        "Your version: " + ".".join(map(str, sys.version_info[:3])),
-        "Install a newer Python version from python.org or pyenv"
-    ]
-))
+# Error code -> (message, severity, category, technical_details, suggestions).
+# Severity and category are enum member names so that each entry is a
+# compile-time constant, loaded straight from the marshalled .pyc rather than
+# rebuilt on import. FernError instances are only built on first lookup.
+_ERROR_SPECS: Dict[str, Tuple[str, str, str, str, Tuple[str, ...]]] = {
+    # -------------------------------------------------------------------------
+    # Core/General Errors (000-099)
+    # -------------------------------------------------------------------------
+
+    "FERN-000": (
+        "An unknown error occurred",
+        "ERROR",
+        "CORE",
+        "No specific error information available",
+        (
+            "Run with FERN_DEBUG=1 for more details",
+            "Check the logs in ~/.fern/fern.log",
+            "Report this issue at https://github.com/autumnsgrove/fern/issues",
+        ),
+    ),
+
+    "FERN-001": (
+        "Fern is not initialized properly",
+        "FATAL",
+        "CORE",
+        "Core initialization failed",
+        (
+            "Try reinstalling Fern: uv pip install -e .",
+            "Check that all dependencies are installed: uv sync",
+            "Verify Python version is 3.11+: python3 --version",
+        ),
+    ),
+
+    "FERN-002": (
+        "Interrupted by user",
+        "INFO",
+        "CORE",
+        "User sent interrupt signal (Ctrl+C)",
+        (
+            "This is normal behavior when canceling an operation",
+            "Your data has been saved up to this point",
+        ),
+    ),
+
+    "FERN-003": (
+        "File permission denied",
+        "ERROR",
+        "CORE",
+        "Cannot read or write required file",
+        (
+            "Check file permissions: ls -la <path>",
+            "Ensure you have write access to the directory",
+            "Try running with sudo (not recommended for regular use)",
+        ),
+    ),
+
+    "FERN-004": (
+        "Path does not exist",
+        "ERROR",
+        "CORE",
+        "Required file or directory path is missing",
+        (
+            "Verify the path is correct",
+            "Create the required directory: mkdir -p <path>",
+            "Run fern status to check your configuration",
+        ),
+    ),
+
+    # -------------------------------------------------------------------------
+    # Audio/Capture Errors (100-199)
+    # -------------------------------------------------------------------------
+
+    "FERN-100": (
+        "No microphone found",
+        "ERROR",
+        "AUDIO",
+        "sounddevice could not find any audio input device",
+        (
+            "Check System Settings → Privacy → Microphone",
+            "Connect a microphone if none is attached",
+            "Try specifying a device: fern test --device 0",
+            "List available devices: fern test --list-devices",
+        ),
+    ),
+
+    "FERN-101": (
+        "Microphone access denied",
+        "ERROR",
+        "AUDIO",
+        "macOS denied microphone access to Fern",
+        (
+            "Open System Settings → Privacy & Security → Microphone",
+            "Enable access for Terminal (or your terminal emulator)",
+            "Restart Fern after granting permissions",
+        ),
+    ),
+
+    "FERN-102": (
+        "Audio device is already in use",
+        "ERROR",
+        "AUDIO",
+        "The requested audio device is busy with another application",
+        (
+            "Close other applications that might be using the microphone",
+            "Select a different device: fern test --device <index>",
+            "Wait for the other application to release the device",
+        ),
+    ),
+
+    "FERN-103": (
+        "Audio capture failed unexpectedly",
+        "ERROR",
+        "AUDIO",
+        "sounddevice raised an unexpected exception during capture",
+        (
+            "Try closing and reopening Fern",
+            "Restart your computer if the issue persists",
+            "Check System Settings → Sound → Input for device health",
+        ),
+    ),
+
+    "FERN-104": (
+        "Invalid audio sample rate",
+        "ERROR",
+        "AUDIO",
+        "Requested sample rate not supported by device",
+        (
+            "Use the default sample rate: fern test",
+            "Check supported rates: fern test --list-devices",
+            "Your device may not support the requested rate",
+        ),
+    ),
+
+    "FERN-105": (
+        "Audio buffer overflow",
+        "WARNING",
+        "AUDIO",
+        "Audio data was lost due to buffer overflow",
+        (
+            "This may happen with slow computers or high CPU load",
+            "Try reducing other system activity during capture",
+            "Consider increasing buffer size in config",
+        ),
+    ),
+
+    "FERN-106": (
+        "No audio input detected",
+        "WARNING",
+        "AUDIO",
+        "Microphone is recording but no voice detected",
+        (
+            "Check your microphone is not muted",
+            "Speak louder or move closer to the microphone",
+            "Verify the input level in System Settings → Sound",
+        ),
+    ),
+
+    # -------------------------------------------------------------------------
+    # Analysis Errors (200-299)
+    # -------------------------------------------------------------------------
+
+    "FERN-200": (
+        "Praat-parselmouth initialization failed",
+        "FATAL",
+        "ANALYSIS",
+        "Could not load praat-parselmouth library",
+        (
+            "Reinstall parselmouth: uv pip install praat-parselmouth",
+            "Ensure you have a compatible Praon installation",
+            "Check Python architecture matches (arm64 vs x86_64)",
+        ),
+    ),
+
+    "FERN-201": (
+        "No pitch detected in audio",
+        "WARNING",
+        "ANALYSIS",
+        "Pitch analysis found no voiced segments",
+        (
+            "Ensure you're speaking during capture",
+            "Check microphone input level",
+            "Try adjusting the pitch range in config",
+            "This is normal for silence or non-voiced sounds",
+        ),
+    ),
+
+    "FERN-202": (
+        "Pitch detection out of range",
+        "WARNING",
+        "ANALYSIS",
+        "Detected pitch is outside expected range",
+        (
+            "Your pitch may be naturally higher or lower than typical",
+            "Adjust target range: fern config:set-target <min> <max>",
+            "This is not necessarily a problem - pitch varies naturally",
+        ),
+    ),
+
+    "FERN-203": (
+        "Resonance analysis failed",
+        "ERROR",
+        "ANALYSIS",
+        "librosa could not extract formants",
+        (
+            "Try capturing audio again with clearer speech",
+            "Reduce background noise",
+            "Ensure sufficient audio quality",
+        ),
+    ),
+
+    "FERN-204": (
+        "Audio file is corrupted or invalid",
+        "ERROR",
+        "ANALYSIS",
+        "Could not decode audio data",
+        (
+            "Try capturing fresh audio",
+            "Check the audio file is not damaged",
+            "Ensure audio is in a supported format (WAV recommended)",
+        ),
+    ),
+
+    "FERN-205": (
+        "Audio too short for analysis",
+        "WARNING",
+        "ANALYSIS",
+        "Audio clip is shorter than minimum required duration",
+        (
+            "Capture longer audio segments",
+            "Try the default 5-second capture duration",
+            "Short clips may not contain enough data for analysis",
+        ),
+    ),
+
+    # -------------------------------------------------------------------------
+    # Database Errors (300-399)
+    # -------------------------------------------------------------------------
+
+    "FERN-300": (
+        "Database connection failed",
+        "FATAL",
+        "DATABASE",
+        "Could not connect to SQLite database",
+        (
+            "Check database file exists: ls ~/.fern/fern.db",
+            "Try restoring from backup: cp ~/.fern/fern.db.backup ~/.fern/fern.db",
+            "Check file permissions on the database file",
+        ),
+    ),
+
+    "FERN-301": (
+        "Database is corrupted",
+        "FATAL",
+        "DATABASE",
+        "SQLite reported corruption or invalid database",
+        (
+            "Restore from backup: cp ~/.fern/fern.db.backup ~/.fern/fern.db",
+            "If no backup exists, the database will be rebuilt (data may be lost)",
+            "Report this issue if it happens repeatedly",
+        ),
+    ),
+
+    "FERN-302": (
+        "Database migration required",
+        "WARNING",
+        "DATABASE",
+        "Database schema version is outdated",
+        (
+            "This is normal after Fern updates",
+            "Your data will be preserved during migration",
+            "If migration fails, a backup will be created automatically",
+        ),
+    ),
+
+    "FERN-303": (
+        "Query returned no results",
+        "INFO",
+        "DATABASE",
+        "Database query executed successfully but found no matching data",
+        (
+            "This is normal for new installations",
+            "Try capturing some audio first: fern test",
+            "Expand your date range: fern trend --days 30",
+        ),
+    ),
+
+    "FERN-304": (
+        "Database constraint violation",
+        "ERROR",
+        "DATABASE",
+        "Insert/update violated database constraints",
+        (
+            "This is usually a programming error",
+            "Report this issue at https://github.com/autumnsgrove/fern/issues",
+            "Your data has been preserved",
+        ),
+    ),
+
+    "FERN-305": (
+        "Database disk is full",
+        "FATAL",
+        "DATABASE",
+        "Cannot write to database - disk full",
+        (
+            "Free up disk space: df -h",
+            "Delete old audio clips: rm ~/.fern/clips/*.wav",
+            "Consider enabling quarterly archiving",
+        ),
+    ),
+
+    # -------------------------------------------------------------------------
+    # Configuration Errors (400-499)
+    # -------------------------------------------------------------------------
+
+    "FERN-400": (
+        "Configuration file not found",
+        "WARNING",
+        "CONFIG",
+        "Could not find config file at expected path",
+        (
+            "A new config will be created with defaults",
+            "Set custom path: FERN_CONFIG=/path/to/config fern status",
+            "Default config path: ~/.fern/config.yaml",
+        ),
+    ),
+
+    "FERN-401": (
+        "Configuration file is corrupted",
+        "ERROR",
+        "CONFIG",
+        "Could not parse YAML configuration",
+        (
+            "Check for syntax errors in the config file",
+            "Restore from backup: cp ~/.fern/config.yaml.backup ~/.fern/config.yaml",
+            "A new default config will be created",
+        ),
+    ),
+
+    "FERN-402": (
+        "Invalid configuration value",
+        "ERROR",
+        "CONFIG",
+        "Configuration value is out of valid range",
+        (
+            "Check the valid range for this setting",
+            "Run fern config:show to see current values",
+            "Reset to defaults: rm ~/.fern/config.yaml",
+        ),
+    ),
+
+    "FERN-403": (
+        "Target pitch range is invalid",
+        "ERROR",
+        "CONFIG",
+        "min_pitch must be less than max_pitch",
+        (
+            "Set a valid range: fern config:set-target 80 250",
+            "Minimum pitch should typically be 50-100 Hz",
+            "Maximum pitch should typically be 200-400 Hz",
+        ),
+    ),
+
+    "FERN-404": (
+        "Unknown configuration key",
+        "WARNING",
+        "CONFIG",
+        "Configuration contains unrecognized keys",
+        (
+            "This may be from an older Fern version",
+            "Unknown keys are ignored but may indicate configuration drift",
+            "Consider regenerating config: rm ~/.fern/config.yaml",
+        ),
+    ),
+
+    # -------------------------------------------------------------------------
+    # CLI/Command Errors (500-599)
+    # -------------------------------------------------------------------------
+
+    "FERN-500": (
+        "Invalid command argument",
+        "ERROR",
+        "CLI",
+        "Command received an invalid argument value",
+        (
+            "Check the command help: fern <command> --help",
+            "Verify argument types (numbers, paths, etc.)",
+            "See usage examples in README.md",
+        ),
+    ),
+
+    "FERN-501": (
+        "Missing required argument",
+        "ERROR",
+        "CLI",
+        "Required command argument was not provided",
+        (
+            "Check the command help: fern <command> --help",
+            "Provide all required arguments",
+            "Example: fern review <session-id>",
+        ),
+    ),
+
+    "FERN-502": (
+        "Unknown command",
+        "ERROR",
+        "CLI",
+        "Specified command does not exist",
+        (
+            "List available commands: fern --help",
+            "Check for typos in the command name",
+            "Some commands may require plugins",
+        ),
+    ),
+
+    "FERN-503": (
+        "Session not found",
+        "ERROR",
+        "CLI",
+        "Requested session ID does not exist",
+        (
+            "List sessions: fern sessions",
+            "Check the session ID is correct",
+            "Session IDs are shown in fern sessions output",
+        ),
+    ),
+
+    "FERN-504": (
+        "Export format not supported",
+        "ERROR",
+        "CLI",
+        "Requested export format is not available",
+        (
+            "Supported formats: csv, json",
+            "Try: fern export --format csv",
+            "Check fern export --help for more options",
+        ),
+    ),
+
+    "FERN-505": (
+        "Output file cannot be written",
+        "ERROR",
+        "CLI",
+        "Cannot create or write to the specified output file",
+        (
+            "Check the file path is valid",
+            "Ensure you have write permission in the target directory",
+            "Try a different output path",
+        ),
+    ),
+
+    # -------------------------------------------------------------------------
+    # WebSocket/IPC Errors (600-699)
+    # -------------------------------------------------------------------------
+
+    "FERN-600": (
+        "WebSocket server not running",
+        "WARNING",
+        "WEBSOCKET",
+        "Cannot connect to Fern WebSocket server",
+        (
+            "Start the Fern server in the background",
+            "The server may already be running on another port",
+            "Fern will work in polling mode without WebSocket",
+        ),
+    ),
+
+    "FERN-601": (
+        "WebSocket connection refused",
+        "ERROR",
+        "WEBSOCKET",
+        "Connection to WebSocket server was refused",
+        (
+            "Check the server is running: ps aux | grep fern",
+            "Verify the port is correct (default: 8765)",
+            "Restart the server if necessary",
+        ),
+    ),
+
+    "FERN-602": (
+        "WebSocket protocol error",
+        "ERROR",
+        "WEBSOCKET",
+        "Received invalid message from WebSocket",
+        (
+            "This may indicate a version mismatch",
+            "Try restarting both Fern and Hammerspoon",
+            "Report this issue if it persists",
+        ),
+    ),
+
+    "FERN-603": (
+        "Signal file communication failed",
+        "WARNING",
+        "WEBSOCKET",
+        "Could not read/write signal files for IPC",
+        (
+            "Check /tmp directory permissions",
+            "Ensure no other process is locking the signal files",
+            "Fern will retry automatically",
+        ),
+    ),
+
+    # -------------------------------------------------------------------------
+    # Hammerspoon/GUI Errors (700-799)
+    # -------------------------------------------------------------------------
+
+    "FERN-700": (
+        "Hammerspoon not installed",
+        "FATAL",
+        "GUI",
+        "Required Hammerspoon application not found",
+        (
+            "Install Hammerspoon: brew install hammerspoon",
+            "Or download from https://www.hammerspoon.org/",
+            "Fern CLI will work without Hammerspoon",
+        ),
+    ),
+
+    "FERN-701": (
+        "Fern Lua module not found",
+        "ERROR",
+        "GUI",
+        "Hammerspoon cannot find Fern Lua files",
+        (
+            "Run ./install.sh to set up Hammerspoon",
+            "Or manually: ln -s $(pwd)/hammerspoon ~/.hammerspoon/fern.lua",
+            "Ensure all .lua files are in ~/.hammerspoon/",
+        ),
+    ),
+
+    "FERN-702": (
+        "Hammerspoon overlay failed to display",
+        "WARNING",
+        "GUI",
+        "Could not create or show the overlay canvas",
+        (
+            "Try reloading Hammerspoon: Ctrl+Cmd+R",
+            "Check Hammerspoon console for errors (Window → Console)",
+            "Ensure no other overlay is blocking the screen",
+        ),
+    ),
+
+    "FERN-703": (
+        "Chart data not available",
+        "INFO",
+        "GUI",
+        "No chart data has been sent to Hammerspoon",
+        (
+            "Run: fern chart --send",
+            "Then toggle chart view: Ctrl+Alt+Shift+C",
+            "Capture some audio first to generate data",
+        ),
+    ),
+
+    # -------------------------------------------------------------------------
+    # Fatal/Recovery Errors (900-999)
+    # -------------------------------------------------------------------------
+
+    "FERN-900": (
+        "Critical system error",
+        "FATAL",
+        "UNKNOWN",
+        "A critical error occurred that prevents continued operation",
+        (
+            "Check logs at ~/.fern/fern.log",
+            "Try restarting Fern",
+            "If this persists, please report this issue",
+            "Your data has been preserved",
+        ),
+    ),
+
+    "FERN-901": (
+        "Out of memory",
+        "FATAL",
+        "UNKNOWN",
+        "System ran out of available memory",
+        (
+            "Close other applications to free memory",
+            "Reduce audio buffer size in configuration",
+            "Consider capturing shorter sessions",
+        ),
+    ),
+
+    "FERN-902": (
+        "Incompatible Python version",
+        "FATAL",
+        "UNKNOWN",
+        "Python version does not meet requirements",
+        (
+            "Fern requires Python 3.11 or later",
+            "Your version: " + _PY_VERSION_STR,
+            "Install a newer Python version from python.org or pyenv",
+        ),
+    ),
+}
 
 
 # =============================================================================
 # ERROR FACTORY FUNCTIONS
 # =============================================================================
 
+# Stand-in for codes missing from the registry; never raised itself
+_UNKNOWN_TEMPLATE = FernError(
+    code="FERN-UNKNOWN",
+    message="Unknown error",
+    severity=ErrorSeverity.ERROR,
+    category=ErrorCategory.UNKNOWN,
+    suggestions=("Report this error at https://github.com/autumnsgrove/fern/issues",),
+)
+
+
 def create_error(
     code: str,
     message: Optional[str] = None,
     severity: Optional[ErrorSeverity] = None,
     category: Optional[ErrorCategory] = None,
-    technical_details: str = "",
-    suggestions: Optional[List[str]] = None,
+    technical_details: Optional[str] = "",
+    suggestions: Optional[Sequence[str]] = None,
     original_exception: Optional[Exception] = None,
     context: Optional[Dict[str, Any]] = None,
 ) -> FernError:
@@ -764,48 +827,78 @@ def create_error(
         message: Optional override for the default message
         severity: Optional override for severity
         category: Optional override for category
-        technical_details: Additional technical details
+        technical_details: Additional technical details; None takes them from
+            str(original_exception) on first read, falling back to the code's
+            registered details when that is empty
         suggestions: Additional suggestions
         original_exception: The original exception that caused this error
         context: Additional context information
 
     Returns:
-        A FernError instance
+        A new FernError instance. Registry entries are templates and are never
+        handed out directly: raising sets __traceback__, __cause__ and
+        __context__ on the instance, so a shared one would leak state between
+        unrelated failures.
     """
-    # Look up base error from registry
-    base_error = _error_registry.get(code)
+    # Look up base error from registry; only cold codes pay for get_error()
+    base_error = _error_registry.get(code) or get_error(code) or _UNKNOWN_TEMPLATE
+    unknown = base_error is _UNKNOWN_TEMPLATE
 
-    if base_error is None:
-        # Unknown error code - create generic error
-        return FernError(
-            code=code,
-            message=message or f"Unknown error: {code}",
-            severity=severity or ErrorSeverity.ERROR,
-            category=category or ErrorCategory.UNKNOWN,
-            technical_details=technical_details,
-            suggestions=suggestions or ["Report this error at https://github.com/autumnsgrove/fern/issues"],
-            original_exception=original_exception,
-            context=context or {}
-        )
+    details: Union[str, _DeferredDetails]
+    if technical_details is None and original_exception is not None:
+        details = _DeferredDetails(original_exception, base_error.technical_details)
+    else:
+        details = technical_details or base_error.technical_details
 
-    # Create error with overrides
     return FernError(
-        code=base_error.code,
-        message=message or base_error.message,
+        code=code if unknown else base_error.code,
+        message=message or (f"Unknown error: {code}" if unknown else base_error.message),
         severity=severity or base_error.severity,
         category=category or base_error.category,
-        technical_details=technical_details or base_error.technical_details,
-        suggestions=suggestions or base_error.suggestions,
+        technical_details=details,
+        suggestions=tuple(suggestions) if suggestions else base_error.suggestions,
         original_exception=original_exception,
         context=context or {}
     )
 
 
+# Per-exception-type suggestions and error codes, looked up by type(exc)
+_EXCEPTION_SUGGESTIONS: Dict[type, Tuple[str, ...]] = {
+    PermissionError: ("Check file permissions",),
+    FileNotFoundError: ("Verify the file path is correct",),
+    ValueError: ("Check the value being used is valid",),
+}
+
+_EXCEPTION_CODES: Dict[type, str] = {
+    PermissionError: "FERN-003",
+    FileNotFoundError: "FERN-004",
+    ValueError: "FERN-500",
+}
+
+
+def _match_exception_type(table: Dict[type, Any], exception: BaseException) -> Any:
+    """Look up an exception in a type-keyed table.
+
+    Tries the exact type first, then walks the MRO so subclasses resolve to
+    their nearest registered base, matching ``isinstance`` semantics.
+
+    Returns:
+        The matching value, or None if no base of the exception is listed.
+    """
+    value = table.get(type(exception))
+    if value is None:
+        for base in type(exception).__mro__[1:]:
+            value = table.get(base)
+            if value is not None:
+                break
+    return value
+
+
 def wrap_exception(
     exception: Exception,
     code: str,
     context: Optional[Dict[str, Any]] = None,
-    extra_suggestions: Optional[List[str]] = None,
+    extra_suggestions: Optional[Sequence[str]] = None,
 ) -> FernError:
     """Wrap an exception in a FernError.
 
@@ -818,25 +911,23 @@ def wrap_exception(
     Returns:
         A FernError wrapping the exception
     """
-    suggestions = extra_suggestions.copy() if extra_suggestions else []
-
     # Add suggestions based on exception type
-    if isinstance(exception, PermissionError):
-        suggestions.append("Check file permissions")
-    elif isinstance(exception, FileNotFoundError):
-        suggestions.append("Verify the file path is correct")
-    elif isinstance(exception, ValueError):
-        suggestions.append("Check the value being used is valid")
+    type_hint = _match_exception_type(_EXCEPTION_SUGGESTIONS, exception) or ()
 
     error = create_error(
         code=code,
-        technical_details=str(exception),
+        technical_details=None,
         original_exception=exception,
         context=context or {}
     )
 
-    if suggestions:
-        error.suggestions = suggestions + error.suggestions
+    if extra_suggestions or type_hint:
+        error = replace(
+            error,
+            # The raw value, so a deferred str(exception) stays deferred
+            technical_details=error.__dict__["_technical_details"],
+            suggestions=(*(extra_suggestions or ()), *type_hint, *error.suggestions),
+        )
 
     return error
 
@@ -844,6 +935,8 @@ def wrap_exception(
 def fern_assert(condition: bool, code: str, context: Optional[Dict[str, Any]] = None) -> None:
     """Assert a condition and raise a FernError if false.
 
+    Like ``assert``, the check is compiled out when Python runs with ``-O``.
+
     Args:
         condition: The condition to check
         code: Error code to use if assertion fails
@@ -852,7 +945,7 @@ def fern_assert(condition: bool, code: str, context: Optional[Dict[str, Any]] =
     Raises:
         FernError: If condition is False
     """
-    if not condition:
+    if __debug__ and not condition:
         raise create_error(code, context=context)
 
 
@@ -865,9 +958,6 @@ def handle_errors(func):
 
     Catches exceptions and converts them to FernError with appropriate codes.
     """
-    import functools
-    import traceback
-
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         try:
@@ -878,17 +968,14 @@ def handle_errors(func):
         except KeyboardInterrupt:
             # Handle Ctrl+C gracefully
             raise create_error("FERN-002")
-        except PermissionError as e:
-            raise wrap_exception(e, "FERN-003", {"operation": func.__name__})
-        except FileNotFoundError as e:
-            raise wrap_exception(e, "FERN-004", {"path": str(e.filename)})
-        except ValueError as e:
-            raise wrap_exception(e, "FERN-500", {"value": str(e)})
         except Exception as e:
-            # Wrap unknown exceptions
-            if os.getenv("FERN_DEBUG"):
-                traceback.print_exc()
-            raise wrap_exception(e, "FERN-000", {"function": func.__name__})
+            code = _match_exception_type(_EXCEPTION_CODES, e)
+            if code is None:
+                # Wrap unknown exceptions
+                code = "FERN-000"
+                if _FERN_DEBUG:
+                    traceback.print_exc()
+            raise wrap_exception(e, code, {"function": func.__name__})
 
     return wrapper
 
@@ -897,6 +984,32 @@ def handle_errors(func):
 # ERROR DISPLAY
 # =============================================================================
 
+_RICH: Optional[Tuple[Any, Any, Any, Any]] = None
+
+_SEVERITY_COLORS: Dict[ErrorSeverity, str] = {
+    ErrorSeverity.INFO: "blue",
+    ErrorSeverity.WARNING: "yellow",
+    ErrorSeverity.ERROR: "red",
+    ErrorSeverity.FATAL: "red",
+}
+
+
+def _rich() -> Tuple[Any, Any, Any, Any]:
+    """Import the Rich display classes once and cache them.
+
+    Returns:
+        (Console, Panel, Text, ROUNDED)
+    """
+    global _RICH
+    if _RICH is None:
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich.text import Text
+        from rich.box import ROUNDED
+        _RICH = (Console, Panel, Text, ROUNDED)
+    return _RICH
+
+
 def display_error(error: FernError, console=None) -> None:
     """Display a FernError to the user.
 
@@ -904,23 +1017,13 @@ def display_error(error: FernError, console=None) -> None:
         error: The error to display
         console: Rich console instance (creates one if not provided)
     """
-    from rich.console import Console
-    from rich.panel import Panel
-    from rich.text import Text
-    from rich.box import ROUNDED
+    Console, Panel, Text, ROUNDED = _rich()
 
     if console is None:
         console = Console()
 
     # Color based on severity
-    severity_colors = {
-        ErrorSeverity.INFO: "blue",
-        ErrorSeverity.WARNING: "yellow",
-        ErrorSeverity.ERROR: "red",
-        ErrorSeverity.FATAL: "red",
-    }
-
-    color = severity_colors.get(error.severity, "red")
+    color = _SEVERITY_COLORS.get(error.severity, "red")
 
     # Build content
     content = Text()
@@ -929,11 +1032,14 @@ def display_error(error: FernError, console=None) -> None:
 
     if error.suggestions:
         content.append("\nSuggestions:\n", style="bold")
-        for suggestion in error.suggestions:
-            content.append(f"  • {suggestion}\n", style="dim")
+        content.append(
+            "".join(f"  • {suggestion}\n" for suggestion in error.suggestions),
+            style="dim",
+        )
 
-    if error.technical_details and os.getenv("FERN_DEBUG"):
-        content.append(f"\nTechnical Details: {error.technical_details}", style="dim")
+    details = error.technical_details if _FERN_DEBUG else ""
+    if details:
+        content.append(f"\nTechnical Details: {details}", style="dim")
 
     panel = Panel(
         content,
@@ -951,7 +1057,7 @@ def display_fatal_error(error: FernError) -> None:
     Args:
         error: The fatal error
     """
-    from rich.console import Console
+    Console = _rich()[0]
 
     console = Console()
     display_error(error, console)
@@ -959,14 +1065,32 @@ def display_fatal_error(error: FernError) -> None:
     # Log to file
     log_error(error)
 
-    # Exit with error code
-    # Extract numeric part of error code for exit code
-    try:
-        exit_code = int(error.code.split("-")[1])
-    except (IndexError, ValueError):
-        exit_code = 1
+    # Exit with the numeric part of the error code
+    sys.exit(error.numeric_code)
+
+
+_LOGGER: Optional[logging.Logger] = None
+_FERN_LOG_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+
+def _get_logger() -> logging.Logger:
+    """Get the "fern" error logger, configuring it on first use."""
+    global _LOGGER
+    if _LOGGER is None:
+        logger = logging.getLogger("fern")
+        logger.setLevel(logging.ERROR)
 
-    sys.exit(min(exit_code, 125))  # Max exit code is 125
+        # Add file handler if not already present
+        if not logger.handlers:
+            handler = logging.FileHandler(os.path.expanduser("~/.fern/fern.log"))
+            handler.setLevel(logging.ERROR)
+            handler.setFormatter(_FERN_LOG_FORMATTER)
+            logger.addHandler(handler)
+
+        _LOGGER = logger
+    return _LOGGER
 
 
 def log_error(error: FernError) -> None:
@@ -975,24 +1099,7 @@ def log_error(error: FernError) -> None:
     Args:
         error: The error to log
     """
-    import logging
-    from datetime import datetime
-
-    log_path = os.path.expanduser("~/.fern/fern.log")
-
-    # Create logger
-    logger = logging.getLogger("fern")
-    logger.setLevel(logging.ERROR)
-
-    # Add file handler if not already present
-    if not logger.handlers:
-        handler = logging.FileHandler(log_path)
-        handler.setLevel(logging.ERROR)
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+    logger = _get_logger()
 
     # Log the error
     log_message = f"{error.code}: {error.message}"
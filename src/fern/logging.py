@@ -5,16 +5,156 @@ Structured logging with levels, file output, and rich console display.
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
-from functools import wraps
+from typing import Optional, Dict, Any, Tuple
+from functools import lru_cache, wraps
 import threading
 
 
+_LOG_FORMAT = "%(asctime)s.%(msecs)03d | %(levelname)-8s | %(name)s | %(message)s"
+_LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+_LOG_BUFFER_SIZE = 64 * 1024
+_LOG_MAX_BYTES = 10 * 1024 * 1024
+_LOG_BACKUP_COUNT = 5
+
+
+_LEVEL_MAP: Dict[str, int] = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Emoji prefix and log level for each log_operation status
+_OPERATION_STATUS: Dict[str, Tuple[str, int]] = {
+    "started": ("🚀", logging.INFO),
+    "completed": ("✅", logging.INFO),
+    "failed": ("❌", logging.ERROR),
+    "running": ("⏳", logging.DEBUG),
+    "skipped": ("⏭️", logging.DEBUG),
+}
+_OTHER_OPERATION_STATUS = ("📝", logging.DEBUG)
+
+
+@lru_cache(maxsize=32)
+def _session_operation(session_id: int) -> str:
+    """Operation label for a session; one session logs many times."""
+    return f"Session #{session_id}"
+
+
+class _FernFormatter(logging.Formatter):
+    """Formatter for Fern's fixed log layout (see _LOG_FORMAT).
+
+    format() builds the line with one f-string instead of walking the
+    %-style template, and the date/time prefix is rendered once per
+    wall-clock second since only the millisecond tail changes in between.
+    """
+
+    def __init__(self):
+        super().__init__(_LOG_FORMAT, datefmt=_LOG_DATEFMT)
+        self._time_cache = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, text = self._time_cache
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._time_cache = (second, text)
+        return text
+
+    def format(self, record: logging.LogRecord) -> str:
+        record.message = record.getMessage()
+        text = (
+            f"{self.formatTime(record, self.datefmt)}.{int(record.msecs):03d} | "
+            f"{record.levelname:<8} | {record.name} | {record.message}"
+        )
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if text[-1:] != "\n":
+                text += "\n"
+            text += record.exc_text
+        if record.stack_info:
+            if text[-1:] != "\n":
+                text += "\n"
+            text += self.formatStack(record.stack_info)
+        return text
+
+
+class _BatchedFileHandler(logging.handlers.RotatingFileHandler):
+    """Rotating file handler that writes through a large stream buffer.
+
+    Records below WARNING are not flushed individually; the owning
+    _BatchingQueueListener calls flush_batch() once the queue is drained, so
+    a burst of records costs one write() instead of one each. The file is
+    opened on the first record rather than at setup.
+    """
+
+    def __init__(self, filename: str):
+        super().__init__(
+            filename,
+            maxBytes=_LOG_MAX_BYTES,
+            backupCount=_LOG_BACKUP_COUNT,
+            encoding="utf-8",
+            delay=True,
+        )
+
+    def _open(self):
+        return open(
+            self.baseFilename, self.mode, buffering=_LOG_BUFFER_SIZE,
+            encoding=self.encoding, errors=self.errors
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.WARNING:
+            self.flush_batch()
+
+    def flush(self) -> None:
+        """Defer flushing to flush_batch()."""
+
+    def flush_batch(self) -> None:
+        """Flush buffered records to disk."""
+        super().flush()
+
+
+class _DirectQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that hands records to the listener thread untouched.
+
+    The stock prepare() copies each record and renders its message and
+    traceback on the calling thread so it can be pickled. The queue never
+    leaves this process, so all of that is left to the listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _BatchingQueueListener(logging.handlers.QueueListener):
+    """QueueListener that flushes batched handlers when the queue runs dry."""
+
+    queue: queue.SimpleQueue[logging.LogRecord]
+
+    def handle(self, record: logging.LogRecord) -> None:
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                if isinstance(handler, _BatchedFileHandler):
+                    handler.flush_batch()
+
+
+# Serializes first-use handler setup; taken once per FernLogger, so one lock suffices
+_SETUP_LOCK = threading.Lock()
+
+
 class FernLogger:
     """Fern logging manager with structured output."""
 
@@ -42,48 +182,61 @@ class FernLogger:
         self.rich_console = rich_console
 
         self._logger: Optional[logging.Logger] = None
-        self._initialized = False
-        self._lock = threading.Lock()
+        self._listener: Optional[_BatchingQueueListener] = None
 
     def _ensure_logger(self) -> logging.Logger:
         """Ensure the logger is initialized."""
         if self._logger is not None:
             return self._logger
 
-        with self._lock:
+        with _SETUP_LOCK:
             if self._logger is not None:
                 return self._logger
 
-            self._logger = logging.getLogger(self.name)
-            self._logger.setLevel(self.level)
+            logger = logging.getLogger(self.name)
+            logger.setLevel(self.level)
 
             # Clear existing handlers
-            self._logger.handlers.clear()
+            logger.handlers.clear()
 
             # Create formatter
-            formatter = logging.Formatter(
-                "%(asctime)s.%(msecs)03d | %(levelname)-8s | %(name)s | %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S"
-            )
+            formatter = _FernFormatter()
 
-            # File handler
+            # File handler; runs on a background listener thread, callers only enqueue
             if self.log_file:
                 Path(self.log_file).parent.mkdir(parents=True, exist_ok=True)
-                file_handler = logging.FileHandler(self.log_file, encoding="utf-8")
+                file_handler = _BatchedFileHandler(self.log_file)
                 file_handler.setLevel(self.level)
                 file_handler.setFormatter(formatter)
-                self._logger.addHandler(file_handler)
 
-            # Console handler
+                log_queue: queue.SimpleQueue = queue.SimpleQueue()
+                logger.addHandler(_DirectQueueHandler(log_queue))
+                self._listener = _BatchingQueueListener(
+                    log_queue, file_handler, respect_handler_level=True
+                )
+                self._listener.start()
+                atexit.register(self.shutdown)
+
+            # Console handler; stays synchronous so lines keep their order
+            # relative to other console output and never outlive the stream
             if self.console_output:
                 console_handler = logging.StreamHandler(sys.stdout)
                 console_handler.setLevel(self.level)
                 console_handler.setFormatter(formatter)
-                self._logger.addHandler(console_handler)
+                logger.addHandler(console_handler)
 
-            self._initialized = True
+            # Publish only once fully configured; the unlocked fast path reads this
+            self._logger = logger
             return self._logger
 
+    def shutdown(self) -> None:
+        """Flush queued records and stop the background listener."""
+        listener, self._listener = self._listener, None
+        if listener is not None:
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
+
     @property
     def logger(self) -> logging.Logger:
         """Get the underlying logger instance."""
@@ -101,15 +254,21 @@ class FernLogger:
 
     def debug(self, message: str, **kwargs) -> None:
         """Log a debug message."""
-        self.logger.debug(self._format_message(message, kwargs))
+        logger = self._logger or self._ensure_logger()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(self._format_message(message, kwargs))
 
     def info(self, message: str, **kwargs) -> None:
         """Log an info message."""
-        self.logger.info(self._format_message(message, kwargs))
+        logger = self._logger or self._ensure_logger()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(self._format_message(message, kwargs))
 
     def warning(self, message: str, **kwargs) -> None:
         """Log a warning message."""
-        self.logger.warning(self._format_message(message, kwargs))
+        logger = self._logger or self._ensure_logger()
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(self._format_message(message, kwargs))
 
     def error(self, message: str, error_code: Optional[str] = None, **kwargs) -> None:
         """Log an error message.
@@ -119,14 +278,19 @@ class FernLogger:
             error_code: Optional error code (e.g., "FERN-100")
             **kwargs: Additional context
         """
+        logger = self._logger or self._ensure_logger()
+        if not logger.isEnabledFor(logging.ERROR):
+            return
         context = kwargs.copy()
         if error_code:
             context["error_code"] = error_code
-        self.logger.error(self._format_message(message, context))
+        logger.error(self._format_message(message, context))
 
     def critical(self, message: str, **kwargs) -> None:
         """Log a critical message."""
-        self.logger.critical(self._format_message(message, kwargs))
+        logger = self._logger or self._ensure_logger()
+        if logger.isEnabledFor(logging.CRITICAL):
+            logger.critical(self._format_message(message, kwargs))
 
     def exception(self, message: str, exc: Exception, **kwargs) -> None:
         """Log an exception with traceback.
@@ -136,9 +300,11 @@ class FernLogger:
             exc: The exception
             **kwargs: Additional context
         """
-        self.logger.exception(
-            self._format_message(message, {"exception": str(exc), **kwargs})
-        )
+        logger = self._logger or self._ensure_logger()
+        if logger.isEnabledFor(logging.ERROR):
+            logger.exception(
+                self._format_message(message, {"exception": str(exc), **kwargs})
+            )
 
     def log_operation(
         self,
@@ -155,25 +321,23 @@ class FernLogger:
             details: Additional details
             error_code: Error code if failed
         """
-        status_emojis = {
-            "started": "🚀",
-            "completed": "✅",
-            "failed": "❌",
-            "running": "⏳",
-            "skipped": "⏭️"
-        }
-        emoji = status_emojis.get(status, "📝")
+        emoji, level = _OPERATION_STATUS.get(status, _OTHER_OPERATION_STATUS)
+        logger = self._logger or self._ensure_logger()
+        if not logger.isEnabledFor(level):
+            return
 
         message = f"{emoji} {operation}: {status}"
         if details:
             message += f" | {details}"
+        if level == logging.ERROR:
+            message = self._format_message(message, {"error_code": error_code})
 
-        if status == "failed":
-            self.error(message, error_code=error_code)
-        elif status in ("completed", "started"):
-            self.info(message)
-        else:
-            self.debug(message)
+        logger.log(level, message)
+
+    def _operation_enabled(self, status: str) -> bool:
+        """Check whether log_operation would emit a record for this status."""
+        level = _OPERATION_STATUS.get(status, _OTHER_OPERATION_STATUS)[1]
+        return (self._logger or self._ensure_logger()).isEnabledFor(level)
 
     def _format_message(self, message: str, kwargs: Dict[str, Any]) -> str:
         """Format message with context.
@@ -185,18 +349,10 @@ class FernLogger:
         Returns:
             Formatted message
         """
-        if not kwargs:
-            return message
-
-        context_parts = []
-        for key, value in kwargs.items():
-            if value is not None:
-                context_parts.append(f"{key}={value}")
-
-        if context_parts:
-            message = f"{message} | {' | '.join(context_parts)}"
-
-        return message
+        context = " | ".join(
+            f"{key}={value}" for key, value in kwargs.items() if value is not None
+        )
+        return f"{message} | {context}" if context else message
 
     def log_session(
         self,
@@ -213,6 +369,9 @@ class FernLogger:
             duration: Session duration in seconds
             readings: Number of readings
         """
+        if not self._operation_enabled(action):
+            return
+
         details = {"session_id": session_id}
         if duration:
             details["duration"] = f"{duration:.1f}s"
@@ -220,7 +379,7 @@ class FernLogger:
             details["readings"] = readings
 
         self.log_operation(
-            operation=f"Session #{session_id}",
+            operation=_session_operation(session_id),
             status=action,
             details=details
         )
@@ -238,6 +397,9 @@ class FernLogger:
             device: Audio device name
             sample_rate: Sample rate in Hz
         """
+        if not self._operation_enabled(action):
+            return
+
         details = {}
         if device:
             details["device"] = device
@@ -252,7 +414,7 @@ class FernLogger:
 
     def log_analysis(
         self,
-        session_id: int,
+        session_id: Optional[int],
         pitch: float,
         f1: Optional[float] = None,
         f2: Optional[float] = None,
@@ -267,11 +429,20 @@ class FernLogger:
             f2: F2 formant (optional)
             f3: F3 formant (optional)
         """
-        message = f"Analysis complete | pitch={pitch:.1f}Hz"
-        if all(v is not None for v in (f1, f2, f3)):
-            message += f" | formants={f1:.0f}/{f2:.0f}/{f3:.0f}"
-
-        self.info(message, session_id=session_id)
+        logger = self._logger or self._ensure_logger()
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        # %-style args defer the float formatting until a handler renders the record
+        message = "Analysis complete | pitch=%.1fHz"
+        args: list = [pitch]
+        if f1 is not None and f2 is not None and f3 is not None:
+            message += " | formants=%.0f/%.0f/%.0f"
+            args += (f1, f2, f3)
+        if session_id is not None:
+            message += " | session_id=%s"
+            args.append(session_id)
+        logger.info(message, *args)
 
 
 # Global logger instance
@@ -314,30 +485,30 @@ def log_function(func):
     Returns:
         Wrapped function with logging
     """
+    op_name = func.__name__
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        logger = get_logger()
-        logger.log_operation(
-            operation=func.__name__,
-            status="started"
-        )
+        logger = _default()
+        # Skip the started/completed records entirely when INFO is off
+        verbose = (logger._logger or logger._ensure_logger()).isEnabledFor(logging.INFO)
+        if verbose:
+            logger.log_operation(operation=op_name, status="started")
         try:
             result = func(*args, **kwargs)
-            logger.log_operation(
-                operation=func.__name__,
-                status="completed"
-            )
-            return result
         except Exception as e:
             logger.exception(
-                f"Function {func.__name__} failed",
+                f"Function {op_name} failed",
                 exc=e
             )
             logger.log_operation(
-                operation=func.__name__,
+                operation=op_name,
                 status="failed"
             )
             raise
+        if verbose:
+            logger.log_operation(operation=op_name, status="completed")
+        return result
 
     return wrapper
 
@@ -356,23 +527,13 @@ def configure_logging(
         verbose: Enable verbose (debug) logging
         quiet: Suppress most output
     """
-    import logging as log_module
-
-    level_map = {
-        "DEBUG": log_module.DEBUG,
-        "INFO": log_module.INFO,
-        "WARNING": log_module.WARNING,
-        "ERROR": log_module.ERROR,
-        "CRITICAL": log_module.CRITICAL
-    }
-
-    log_level = level_map.get(level.upper(), log_module.INFO)
+    log_level = _LEVEL_MAP.get(level.upper(), logging.INFO)
 
     if verbose:
-        log_level = log_module.DEBUG
+        log_level = logging.DEBUG
 
     if quiet:
-        log_level = log_module.WARNING
+        log_level = logging.WARNING
 
     logger = get_logger()
     logger.set_level(log_level)
@@ -381,45 +542,63 @@ def configure_logging(
         os.environ["FERN_DEBUG"] = "1"
 
 
-# Create default logger for convenience
-default_logger = get_logger()
+def __getattr__(name: str) -> Any:
+    """Create ``default_logger`` on first access instead of at import."""
+    if name == "default_logger":
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _default() -> FernLogger:
+    """Get the shared logger, creating it on first use."""
+    return _default_logger or get_logger()
+
+
+def preallocate() -> None:
+    """Set up the default logger's handlers and listener thread now.
+
+    Call from a latency-sensitive thread (e.g. audio capture) before its
+    loop starts so the first log call does not open files or spawn threads.
+    """
+    _default()._ensure_logger()
+
 
 # Convenience functions that use the default logger
 def debug(message: str, **kwargs) -> None:
     """Log a debug message."""
-    default_logger.debug(message, **kwargs)
+    _default().debug(message, **kwargs)
 
 
 def info(message: str, **kwargs) -> None:
     """Log an info message."""
-    default_logger.info(message, **kwargs)
+    _default().info(message, **kwargs)
 
 
 def warning(message: str, **kwargs) -> None:
     """Log a warning message."""
-    default_logger.warning(message, **kwargs)
+    _default().warning(message, **kwargs)
 
 
 def error(message: str, **kwargs) -> None:
     """Log an error message."""
-    default_logger.error(message, **kwargs)
+    _default().error(message, **kwargs)
 
 
 def critical(message: str, **kwargs) -> None:
     """Log a critical message."""
-    default_logger.critical(message, **kwargs)
+    _default().critical(message, **kwargs)
 
 
 def log_session(session_id: int, action: str, **kwargs) -> None:
     """Log session activity."""
-    default_logger.log_session(session_id, action, **kwargs)
+    _default().log_session(session_id, action, **kwargs)
 
 
 def log_capture(action: str, **kwargs) -> None:
     """Log audio capture activity."""
-    default_logger.log_capture(action, **kwargs)
+    _default().log_capture(action, **kwargs)
 
 
-def log_analysis(session_id: int, pitch: float, **kwargs) -> None:
+def log_analysis(session_id: Optional[int], pitch: float, **kwargs) -> None:
     """Log analysis result."""
-    default_logger.log_analysis(session_id, pitch, **kwargs)
+    _default().log_analysis(session_id, pitch, **kwargs)
@@ -3,13 +3,94 @@
 Dataclasses for Session, Reading, Target, and other core entities.
 """
 
-from dataclasses import dataclass, field
+from array import array
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Iterable, Callable, Tuple, Union, overload
 from pathlib import Path
+import json
+import math
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+    """Field names of a dataclass, in declaration order, cached per class."""
+    names = _FIELD_NAMES.get(cls)
+    if names is None:
+        names = _FIELD_NAMES[cls] = tuple(f.name for f in fields(cls))
+    return names
+
+
+def _dc_to_dict(obj: Any) -> Dict[str, Any]:
+    """Convert a model dataclass to a dict, ISO-formatting datetimes."""
+    result = {}
+    for name in _field_names(type(obj)):
+        value = getattr(obj, name)
+        result[name] = value.isoformat() if isinstance(value, datetime) else value
+    return result
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Check whether a model dataclass has a NaN or infinite float field."""
+    for name in _field_names(type(obj)):
+        value = getattr(obj, name)
+        if isinstance(value, float) and not math.isfinite(value):
+            return True
+    return False
+
+
+def _dc_to_json_bytes(obj: Any) -> bytes:
+    """Serialize a model dataclass to compact UTF-8 JSON.
+
+    Uses orjson directly on the dataclass when installed, skipping the
+    intermediate dict; otherwise falls back to json on to_dict(). orjson
+    writes NaN and infinity as null, so models holding them use json too
+    and serialize the same way whether or not orjson is installed.
+    """
+    if ORJSON_AVAILABLE and not _has_non_finite(obj):
+        return orjson.dumps(obj)
+    return json.dumps(
+        _dc_to_dict(obj), separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+@overload
+def _parse_dt(
+    value: Union[str, datetime, None], default: Callable[[], datetime]
+) -> datetime: ...
+
+
+@overload
+def _parse_dt(
+    value: Union[str, datetime, None], default: None = None
+) -> Optional[datetime]: ...
+
+
+def _parse_dt(
+    value: Union[str, datetime, None], default: Optional[Callable[[], datetime]] = None
+) -> Optional[datetime]:
+    """Parse an ISO timestamp from a dict value, passing datetimes through.
+
+    Args:
+        value: ISO string, datetime or None.
+        default: Factory called when value is None.
+    """
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if value is None and default is not None:
+        return default()
+    return value
+
+
+@dataclass(slots=True)
 class Reading:
     """A single pitch/resonance reading from an audio sample."""
     id: Optional[int] = None
@@ -45,28 +126,11 @@ class Reading:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
-        return {
-            'id': self.id,
-            'session_id': self.session_id,
-            'timestamp': self.timestamp.isoformat(),
-            'median_pitch': self.median_pitch,
-            'mean_pitch': self.mean_pitch,
-            'min_pitch': self.min_pitch,
-            'max_pitch': self.max_pitch,
-            'std_pitch': self.std_pitch,
-            'voiced_frames': self.voiced_frames,
-            'total_frames': self.total_frames,
-            'voicing_rate': self.voicing_rate,
-            'f1_mean': self.f1_mean,
-            'f2_mean': self.f2_mean,
-            'f3_mean': self.f3_mean,
-            'f1_std': self.f1_std,
-            'f2_std': self.f2_std,
-            'f3_std': self.f3_std,
-            'clip_path': self.clip_path,
-            'duration_seconds': self.duration_seconds,
-            'device_id': self.device_id,
-        }
+        return _dc_to_dict(self)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON bytes."""
+        return _dc_to_json_bytes(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Reading':
@@ -74,7 +138,7 @@ class Reading:
         return cls(
             id=data.get('id'),
             session_id=data.get('session_id'),
-            timestamp=datetime.fromisoformat(data['timestamp']) if isinstance(data.get('timestamp'), str) else data.get('timestamp', datetime.now()),
+            timestamp=_parse_dt(data.get('timestamp'), datetime.now),
             median_pitch=data.get('median_pitch', 0.0),
             mean_pitch=data.get('mean_pitch', 0.0),
             min_pitch=data.get('min_pitch', 0.0),
@@ -94,8 +158,14 @@ class Reading:
             device_id=data.get('device_id'),
         )
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> List['Reading']:
+        """Create readings from many dictionaries (e.g. a JSON export)."""
+        from_dict = cls.from_dict
+        return [from_dict(row) for row in rows]
+
 
-@dataclass
+@dataclass(slots=True)
 class Target:
     """Voice training target range."""
     id: Optional[int] = None
@@ -117,16 +187,11 @@ class Target:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
-        return {
-            'id': self.id,
-            'name': self.name,
-            'created_at': self.created_at.isoformat(),
-            'min_pitch': self.min_pitch,
-            'max_pitch': self.max_pitch,
-            'voice_type': self.voice_type,
-            'target_f2': self.target_f2,
-            'is_active': self.is_active,
-        }
+        return _dc_to_dict(self)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON bytes."""
+        return _dc_to_json_bytes(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Target':
@@ -134,7 +199,7 @@ class Target:
         return cls(
             id=data.get('id'),
             name=data.get('name', 'Default'),
-            created_at=datetime.fromisoformat(data['created_at']) if isinstance(data.get('created_at'), str) else data.get('created_at', datetime.now()),
+            created_at=_parse_dt(data.get('created_at'), datetime.now),
             min_pitch=data.get('min_pitch', 80.0),
             max_pitch=data.get('max_pitch', 250.0),
             voice_type=data.get('voice_type'),
@@ -143,7 +208,7 @@ class Target:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Session:
     """A practice session containing multiple readings."""
     id: Optional[int] = None
@@ -162,17 +227,11 @@ class Session:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
-        return {
-            'id': self.id,
-            'name': self.name,
-            'start_time': self.start_time.isoformat(),
-            'end_time': self.end_time.isoformat() if self.end_time else None,
-            'target_id': self.target_id,
-            'reading_count': self.reading_count,
-            'avg_median_pitch': self.avg_median_pitch,
-            'avg_voicing_rate': self.avg_voicing_rate,
-            'notes': self.notes,
-        }
+        return _dc_to_dict(self)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON bytes."""
+        return _dc_to_json_bytes(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Session':
@@ -180,8 +239,8 @@ class Session:
         return cls(
             id=data.get('id'),
             name=data.get('name'),
-            start_time=datetime.fromisoformat(data['start_time']) if isinstance(data.get('start_time'), str) else data.get('start_time', datetime.now()),
-            end_time=datetime.fromisoformat(data['end_time']) if isinstance(data.get('end_time'), str) else data.get('end_time'),
+            start_time=_parse_dt(data.get('start_time'), datetime.now),
+            end_time=_parse_dt(data.get('end_time')),
             target_id=data.get('target_id'),
             reading_count=data.get('reading_count', 0),
             avg_median_pitch=data.get('avg_median_pitch', 0.0),
@@ -190,7 +249,7 @@ class Session:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionSummary:
     """Aggregated statistics for a session or time period."""
     session_id: Optional[int] = None
@@ -208,6 +267,9 @@ class SessionSummary:
     max_median_pitch: float = 0.0
     pitch_std: float = 0.0
     
+    # Voicing stats
+    avg_voicing_rate: float = 0.0
+    
     # Pitch range compliance
     in_range_percentage: float = 0.0
     
@@ -217,18 +279,102 @@ class SessionSummary:
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
-        return {
-            'session_id': self.session_id,
-            'period_start': self.period_start.isoformat() if self.period_start else None,
-            'period_end': self.period_end.isoformat() if self.period_end else None,
-            'total_readings': self.total_readings,
-            'readings_in_range': self.readings_in_range,
-            'readings_out_of_range': self.readings_out_of_range,
-            'avg_median_pitch': self.avg_median_pitch,
-            'min_median_pitch': self.min_median_pitch,
-            'max_median_pitch': self.max_median_pitch,
-            'pitch_std': self.pitch_std,
-            'in_range_percentage': self.in_range_percentage,
-            'pitch_trend': self.pitch_trend,
-            'pitch_trend_delta': self.pitch_trend_delta,
-        }
+        return _dc_to_dict(self)
+
+    def to_json_bytes(self) -> bytes:
+        """Serialize to compact JSON bytes."""
+        return _dc_to_json_bytes(self)
+
+    @classmethod
+    def from_readings(
+        cls,
+        readings: Iterable[Reading],
+        target: Optional['Target'] = None,
+        session_id: Optional[int] = None,
+    ) -> 'SessionSummary':
+        """Summarize in-memory readings with vectorized NumPy reductions.
+
+        Args:
+            readings: Readings to aggregate.
+            target: Optional target for range comparison.
+            session_id: Session ID to record on the summary.
+
+        Returns:
+            SessionSummary matching Database.get_session_summary semantics.
+        """
+        return ReadingBatch(readings, session_id=session_id).compute_summary(target)
+
+
+class ReadingBatch:
+    """Column-oriented store of readings for bulk statistics.
+
+    Readings are appended into contiguous float64 columns so a summary over
+    a long session is a handful of NumPy reductions instead of a Python loop
+    over Reading objects.
+    """
+
+    __slots__ = ("session_id", "median_pitch", "std_pitch", "voicing_rate")
+
+    def __init__(self, readings: Iterable[Reading] = (), session_id: Optional[int] = None):
+        """Initialize the batch.
+
+        Args:
+            readings: Readings to add up front.
+            session_id: Session the readings belong to, copied into summaries.
+        """
+        self.session_id = session_id
+        self.median_pitch = array("d")
+        self.std_pitch = array("d")
+        self.voicing_rate = array("d")
+        self.extend(readings)
+
+    def __len__(self) -> int:
+        """Number of readings in the batch."""
+        return len(self.median_pitch)
+
+    def append(self, reading: Reading) -> None:
+        """Add a single reading's columns to the batch."""
+        self.median_pitch.append(reading.median_pitch)
+        self.std_pitch.append(reading.std_pitch)
+        self.voicing_rate.append(reading.voicing_rate)
+
+    def extend(self, readings: Iterable[Reading]) -> None:
+        """Add several readings to the batch."""
+        for reading in readings:
+            self.append(reading)
+
+    def compute_summary(self, target: Optional['Target'] = None) -> SessionSummary:
+        """Aggregate the batch the same way Database.get_session_summary does.
+
+        Args:
+            target: Optional target for range comparison.
+
+        Returns:
+            SessionSummary for the batched readings.
+        """
+        total = len(self)
+        if total == 0:
+            return SessionSummary(session_id=self.session_id)
+
+        import numpy as np
+
+        pitch = np.frombuffer(self.median_pitch, dtype=np.float64)
+        if target and target.min_pitch > 0:
+            in_range = int(np.count_nonzero(
+                (pitch >= target.min_pitch) & (pitch <= target.max_pitch)
+            ))
+        else:
+            in_range = 0
+
+        return SessionSummary(
+            session_id=self.session_id,
+            total_readings=total,
+            readings_in_range=in_range,
+            readings_out_of_range=total - in_range,
+            avg_median_pitch=float(pitch.mean()),
+            min_median_pitch=float(pitch.min()),
+            max_median_pitch=float(pitch.max()),
+            pitch_std=float(np.frombuffer(self.std_pitch, dtype=np.float64).mean()),
+            avg_voicing_rate=float(np.frombuffer(self.voicing_rate, dtype=np.float64).mean()),
+            in_range_percentage=in_range / total * 100,
+        )
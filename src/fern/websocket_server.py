@@ -5,13 +5,19 @@ Handles capture status updates, pitch/resonance data streaming, and command disp
 """
 
 import asyncio
+import contextlib
 import json
 import logging
+import math
+from json.encoder import encode_basestring_ascii
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any
-from dataclasses import dataclass, asdict
+from typing import Optional, Callable, Dict, Any, Tuple, Awaitable, Union
+from dataclasses import dataclass, replace
 import threading
 import os
+import select
+import sys
+import tempfile
 
 try:
     import websockets
@@ -19,11 +25,91 @@ try:
 except ImportError:
     WEBSOCKETS_AVAILABLE = False
 
+try:
+    import msgspec
+    _msgpack_encode = msgspec.msgpack.Encoder().encode
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    def _dumps(obj: Any) -> str:
+        """Serialize a message to compact JSON text."""
+        return orjson.dumps(obj).decode()
+
+    _loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+else:
+    def _dataclass_fields(obj: Any) -> Dict[str, Any]:
+        """json default hook: a flat dataclass as a dict of its fields."""
+        fields = getattr(obj, "__dataclass_fields__", None)
+        if fields is None:
+            raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+        return {name: getattr(obj, name) for name in fields}
+
+    def _dumps(obj: Any) -> str:
+        """Serialize a message to compact JSON text."""
+        return json.dumps(obj, separators=(",", ":"), default=_dataclass_fields)
+
+    _loads = json.loads
+
 
 logger = logging.getLogger(__name__)
 
+# Broadcasts buffered per client before new ones are dropped
+_CLIENT_QUEUE_SIZE = 256
+
+# Constant framing of {"type": ..., "data": ...} messages; only data is encoded
+_STATUS_PREFIX = '{"type":"status","data":'
+_ANALYSIS_PREFIX = '{"type":"analysis","data":'
+
+_PONG_MESSAGE = '{"type":"pong"}'
+_PING_MESSAGES = frozenset(
+    spelling
+    for text in ('{"command":"ping"}', '{"command": "ping"}')
+    for spelling in (text, text.encode())
+)
+
+# Maximum rate of analysis broadcasts; a GUI cannot use more than this
+ANALYSIS_BROADCAST_HZ = 30
+
+# Seconds stop() waits for connections to close before cancelling them
+_STOP_TIMEOUT = 1.0
+
+# Backoff bounds for wait_capture_state_change when kqueue is unavailable
+_POLL_MIN_INTERVAL = 0.1
+_POLL_MAX_INTERVAL = 1.0
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Replace a file's contents so readers never see a partial write.
+
+    Writes to a uniquely named sibling and renames it over the target; the
+    rename is atomic, so Hammerspoon reads either the old or the new file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        try:
+            os.fchmod(fd, 0o644)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
 
-@dataclass
+@dataclass(slots=True)
 class CaptureStatus:
     """Status of an audio capture session."""
     is_capturing: bool = False
@@ -32,7 +118,7 @@ class CaptureStatus:
     start_time: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Analysis result to send to GUI."""
     median_pitch: float = 0.0
@@ -45,6 +131,36 @@ class AnalysisResult:
     timestamp: Optional[str] = None
 
 
+if ORJSON_AVAILABLE:
+    def _encode_analysis(result: AnalysisResult) -> str:
+        """Encode an analysis broadcast message."""
+        return _ANALYSIS_PREFIX + _dumps(result) + "}"
+else:
+    # Without orjson, filling a fixed template is ~2.5x faster than json.dumps
+    _ANALYSIS_TEMPLATE = (
+        _ANALYSIS_PREFIX
+        + '{"median_pitch":%s,"mean_pitch":%s,"f1_mean":%s,"f2_mean":%s,'
+        '"f3_mean":%s,"in_range":%s,"deviation":%s,"timestamp":%s}}'
+    )
+
+    def _encode_analysis(result: AnalysisResult) -> str:
+        """Encode an analysis broadcast message."""
+        numbers = (
+            result.median_pitch, result.mean_pitch, result.f1_mean,
+            result.f2_mean, result.f3_mean, result.deviation,
+        )
+        # NaN/inf need json's spelling; let the general encoder handle them
+        if not all(map(math.isfinite, numbers)):
+            return _ANALYSIS_PREFIX + _dumps(result) + "}"
+        timestamp = result.timestamp
+        return _ANALYSIS_TEMPLATE % (
+            *numbers[:5],
+            "true" if result.in_range else "false",
+            numbers[5],
+            "null" if timestamp is None else encode_basestring_ascii(timestamp),
+        )
+
+
 class WebSocketServer:
     """WebSocket server for Fern IPC."""
 
@@ -65,10 +181,35 @@ class WebSocketServer:
         self.port = port
         self.signal_file = signal_file
         self._server: Optional[asyncio.Server] = None
-        self._clients: set = set()
+        # Connected clients mapped to their outgoing message queues
+        self._clients: Dict[Any, asyncio.Queue] = {}
+        # Per-connection handler tasks, cancelled if shutdown stalls
+        self._conn_tasks: set = set()
+        self._dropped_messages = 0
+        # Clients receiving analysis as MessagePack (see set_encoding)
+        self._binary_clients: set = set()
+        # Immutable view of the above for broadcast loops; rebuilt on change
+        self._broadcast_targets: Tuple[Tuple[asyncio.Queue, bool], ...] = ()
         self._capture_status = CaptureStatus()
+        # Encoded status message, rebuilt only after the status changes
+        self._status_message: Optional[str] = None
+        # Last analysis result and its encoded message
+        self._last_analysis: Optional[Tuple[AnalysisResult, str]] = None
+        # Throttle state for broadcast_analysis
+        self._analysis_timer: Optional[asyncio.TimerHandle] = None
+        self._pending_analysis: Optional[AnalysisResult] = None
         self._analysis_callback: Optional[Callable[[AnalysisResult], None]] = None
         self._running = False
+        self._signal_lock = asyncio.Lock()
+        # Command name -> handler(websocket, data)
+        self._handlers: Dict[str, Callable[[Any, Dict[str, Any]], Awaitable[None]]] = {
+            "status": self._send_status,
+            "start_capture": self._handle_start_capture,
+            "stop_capture": self._handle_stop_capture,
+            "get_targets": self._send_targets,
+            "ping": self._send_pong,
+            "set_encoding": self._handle_set_encoding,
+        }
 
     def set_analysis_callback(self, callback: Callable[[AnalysisResult], None]) -> None:
         """Set callback for analysis results.
@@ -78,24 +219,55 @@ class WebSocketServer:
         """
         self._analysis_callback = callback
 
-    def _update_signal_file(self) -> None:
-        """Update signal file with current capture status."""
-        if self.signal_file:
-            try:
-                status_data = {
-                    "is_capturing": self._capture_status.is_capturing,
-                    "device_name": self._capture_status.device_name,
-                    "timestamp": self._capture_status.start_time
-                }
-                self.signal_file.parent.mkdir(parents=True, exist_ok=True)
-                self.signal_file.write_text(json.dumps(status_data))
-            except Exception as e:
-                logger.warning(f"Failed to update signal file: {e}")
+    def _set_capture_status(self, status: CaptureStatus) -> None:
+        """Replace the capture status, dropping its cached encoding if it changed."""
+        if status != self._capture_status:
+            self._capture_status = status
+            self._status_message = None
+
+    def _status_payload(self) -> str:
+        """Get the encoded status message, encoding it on first use."""
+        if self._status_message is None:
+            self._status_message = _STATUS_PREFIX + _dumps(self._capture_status) + "}"
+        return self._status_message
+
+    def _analysis_payload(self, result: AnalysisResult) -> str:
+        """Encode an analysis message and remember it as the last one sent."""
+        message = _encode_analysis(result)
+        # Keep a snapshot so later mutation of the caller's object is noticed
+        self._last_analysis = (replace(result), message)
+        return message
+
+    async def _update_signal_file(self) -> None:
+        """Update signal file with current capture status.
+
+        The write runs in a worker thread so disk I/O does not stall other
+        clients; the lock keeps successive updates landing in order.
+        """
+        signal_file = self.signal_file
+        if signal_file:
+            status_data = {
+                "is_capturing": self._capture_status.is_capturing,
+                "device_name": self._capture_status.device_name,
+                "timestamp": self._capture_status.start_time
+            }
+            async with self._signal_lock:
+                await asyncio.to_thread(self._write_signal_file, signal_file, _dumps(status_data))
+
+    def _write_signal_file(self, path: Path, payload: str) -> None:
+        """Write the signal file (runs in a worker thread)."""
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(path, payload.encode())
+        except Exception as e:
+            logger.warning(f"Failed to update signal file: {e}")
 
     async def _handle_client(self, websocket):
         """Handle a connected client."""
         client_id = id(websocket)
-        self._clients.add(websocket)
+        task = asyncio.current_task()
+        self._conn_tasks.add(task)
+        writer = self._register_client(websocket)
         logger.info(f"Client connected: {client_id}")
 
         try:
@@ -104,54 +276,146 @@ class WebSocketServer:
         except Exception as e:
             logger.debug(f"Client error: {e}")
         finally:
-            self._clients.discard(websocket)
+            self._unregister_client(websocket)
+            self._conn_tasks.discard(task)
+            writer.cancel()
             logger.info(f"Client disconnected: {client_id}")
 
+    def _register_client(self, websocket) -> asyncio.Task:
+        """Add a client and start the task that writes its broadcasts."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_CLIENT_QUEUE_SIZE)
+        # Unchanged results are not re-broadcast, so start the client off
+        # with the latest one instead of waiting for the value to change
+        if self._last_analysis is not None:
+            queue.put_nowait(self._last_analysis[1])
+        self._clients[websocket] = queue
+        self._refresh_client_snapshot()
+        return asyncio.create_task(self._writer(websocket, queue))
+
+    def _unregister_client(self, websocket) -> None:
+        """Remove a client so it receives no further broadcasts."""
+        self._clients.pop(websocket, None)
+        self._binary_clients.discard(websocket)
+        self._refresh_client_snapshot()
+
+    def _refresh_client_snapshot(self) -> None:
+        """Rebuild the (queue, wants_binary) tuple that broadcasts iterate."""
+        self._broadcast_targets = tuple(
+            (queue, websocket in self._binary_clients)
+            for websocket, queue in self._clients.items()
+        )
+
+    async def _writer(self, websocket, queue: asyncio.Queue) -> None:
+        """Send queued broadcasts to one client until it goes away."""
+        try:
+            while True:
+                await websocket.send(await queue.get())
+        except Exception as e:
+            logger.debug(f"Client writer stopped: {e}")
+
+    def _enqueue_broadcast(self, message: str, binary_message: Optional[bytes] = None) -> None:
+        """Queue a message for every client, dropping it for clients that are full.
+
+        Args:
+            message: JSON text message.
+            binary_message: MessagePack variant for clients that asked for it.
+        """
+        for queue, wants_binary in self._broadcast_targets:
+            self._enqueue(
+                queue, binary_message if wants_binary and binary_message is not None else message
+            )
+
+    def _enqueue(self, queue: asyncio.Queue, message: Any) -> None:
+        """Queue a message for one client, dropping it if the client is full."""
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self._dropped_messages += 1
+            logger.debug(f"Dropped broadcast for slow client ({self._dropped_messages} total)")
+
+    async def _reply(self, websocket, message: str) -> None:
+        """Send a direct reply behind the client's already queued broadcasts.
+
+        Replies go through the same queue as broadcasts so the client sees
+        messages in the order the server produced them. Unlike broadcasts,
+        replies wait for queue space rather than being dropped.
+        """
+        queue = self._clients.get(websocket)
+        if queue is None:
+            await websocket.send(message)
+        else:
+            await queue.put(message)
+
     async def _process_message(self, websocket, message: str) -> None:
         """Process incoming message from client."""
+        # Keepalives in their usual spellings skip JSON parsing entirely
+        if message in _PING_MESSAGES:
+            await self._reply(websocket, _PONG_MESSAGE)
+            return
+
         try:
-            data = json.loads(message)
-            command = data.get("command")
-
-            if command == "status":
-                await self._send_status(websocket)
-            elif command == "start_capture":
-                await self._handle_start_capture(data)
-            elif command == "stop_capture":
-                await self._handle_stop_capture()
-            elif command == "get_targets":
-                await self._send_targets(websocket)
-            elif command == "ping":
-                await websocket.send(json.dumps({"type": "pong"}))
+            data = _loads(message)
+            handler = self._handlers.get(data.get("command"))
+            if handler is not None:
+                await handler(websocket, data)
         except json.JSONDecodeError:
-            await websocket.send(json.dumps({"type": "error", "message": "Invalid JSON"}))
+            await self._reply(websocket, _dumps({"type": "error", "message": "Invalid JSON"}))
         except Exception as e:
-            await websocket.send(json.dumps({"type": "error", "message": str(e)}))
+            await self._reply(websocket, _dumps({"type": "error", "message": str(e)}))
+
+    async def _handle_set_encoding(self, websocket, data: Dict[str, Any]) -> None:
+        """Handle set encoding command.
 
-    async def _send_status(self, websocket) -> None:
+        Clients that ask for "msgpack" receive analysis broadcasts as binary
+        MessagePack frames; everything else stays JSON text. The reply names
+        the encoding actually in effect, which is "json" when msgspec is not
+        installed.
+        """
+        was_binary = websocket in self._binary_clients
+        if data.get("encoding") == "msgpack" and MSGSPEC_AVAILABLE:
+            self._binary_clients.add(websocket)
+            encoding = "msgpack"
+        else:
+            self._binary_clients.discard(websocket)
+            encoding = "json"
+        self._refresh_client_snapshot()
+        await self._reply(websocket, _dumps({"type": "encoding", "encoding": encoding}))
+
+        # Unchanged results are not re-broadcast, so re-send the latest one
+        # to this client alone in its new encoding
+        last = self._last_analysis
+        queue = self._clients.get(websocket)
+        if last is not None and queue is not None and was_binary != (encoding == "msgpack"):
+            if encoding == "msgpack":
+                self._enqueue(queue, _msgpack_encode({"type": "analysis", "data": last[0]}))
+            else:
+                self._enqueue(queue, last[1])
+
+    async def _send_pong(self, websocket, data: Dict[str, Any]) -> None:
+        """Reply to a ping."""
+        await self._reply(websocket, _PONG_MESSAGE)
+
+    async def _send_status(self, websocket, data: Dict[str, Any]) -> None:
         """Send current status to client."""
-        await websocket.send(json.dumps({
-            "type": "status",
-            "data": asdict(self._capture_status)
-        }))
+        await self._reply(websocket, self._status_payload())
 
-    async def _handle_start_capture(self, data: Dict[str, Any]) -> None:
+    async def _handle_start_capture(self, websocket, data: Dict[str, Any]) -> None:
         """Handle start capture command."""
-        self._capture_status = CaptureStatus(
+        self._set_capture_status(CaptureStatus(
             is_capturing=True,
             device_name=data.get("device_name"),
             sample_rate=data.get("sample_rate", 44100)
-        )
-        self._update_signal_file()
+        ))
+        await self._update_signal_file()
         await self._broadcast_status()
 
-    async def _handle_stop_capture(self) -> None:
+    async def _handle_stop_capture(self, websocket, data: Dict[str, Any]) -> None:
         """Handle stop capture command."""
-        self._capture_status = CaptureStatus()
-        self._update_signal_file()
+        self._set_capture_status(CaptureStatus())
+        await self._update_signal_file()
         await self._broadcast_status()
 
-    async def _send_targets(self, websocket) -> None:
+    async def _send_targets(self, websocket, data: Dict[str, Any]) -> None:
         """Send available targets to client."""
         try:
             from .db import get_default_db
@@ -167,45 +431,63 @@ class WebSocketServer:
                 }
                 for t in targets
             ]
-            await websocket.send(json.dumps({"type": "targets", "data": targets_data}))
+            await self._reply(websocket, _dumps({"type": "targets", "data": targets_data}))
         except Exception as e:
-            await websocket.send(json.dumps({"type": "error", "message": str(e)}))
+            await self._reply(websocket, _dumps({"type": "error", "message": str(e)}))
 
     async def _broadcast_status(self) -> None:
         """Broadcast status to all connected clients."""
         if not self._clients:
             return
 
-        message = json.dumps({
-            "type": "status",
-            "data": asdict(self._capture_status)
-        })
-
-        # Send to all clients concurrently
-        await asyncio.gather(
-            *(client.send(message) for client in self._clients),
-            return_exceptions=True
-        )
+        self._enqueue_broadcast(self._status_payload())
 
     async def broadcast_analysis(self, result: AnalysisResult) -> None:
         """Broadcast analysis result to all connected clients.
 
+        Results are throttled to ANALYSIS_BROADCAST_HZ: the first result in a
+        window goes out immediately, later ones replace each other and only
+        the newest is sent when the window closes.
+
         Args:
             result: Analysis result to broadcast.
         """
         if not self._clients:
             return
 
-        message = json.dumps({
-            "type": "analysis",
-            "data": asdict(result)
-        })
+        if self._analysis_timer is not None:
+            self._pending_analysis = result
+            return
+
+        self._send_analysis(result)
+        self._analysis_timer = asyncio.get_running_loop().call_later(
+            1 / ANALYSIS_BROADCAST_HZ, self._flush_analysis
+        )
+
+    def _flush_analysis(self) -> None:
+        """Send the newest result held back during the last throttle window."""
+        result, self._pending_analysis = self._pending_analysis, None
+        if result is None:
+            self._analysis_timer = None
+            return
 
-        await asyncio.gather(
-            *(client.send(message) for client in self._clients),
-            return_exceptions=True
+        self._send_analysis(result)
+        self._analysis_timer = asyncio.get_running_loop().call_later(
+            1 / ANALYSIS_BROADCAST_HZ, self._flush_analysis
         )
 
+    def _send_analysis(self, result: AnalysisResult) -> None:
+        """Queue an analysis result for all clients unless it repeats the last one."""
+        # Identical consecutive results (e.g. silent frames) are not re-sent
+        last = self._last_analysis
+        if last is not None and last[0] == result:
+            return
+
+        binary_message = None
+        if self._binary_clients:
+            binary_message = _msgpack_encode({"type": "analysis", "data": result})
+        self._enqueue_broadcast(self._analysis_payload(result), binary_message)
+
     async def start(self) -> None:
         """Start the WebSocket server."""
         if not WEBSOCKETS_AVAILABLE:
@@ -224,9 +506,26 @@ class WebSocketServer:
     async def stop(self) -> None:
         """Stop the WebSocket server."""
         self._running = False
+        if self._analysis_timer is not None:
+            self._analysis_timer.cancel()
+            self._analysis_timer = None
+            self._pending_analysis = None
         if self._server:
             self._server.close()
-            await self._server.wait_closed()
+            try:
+                await asyncio.wait_for(self._server.wait_closed(), _STOP_TIMEOUT)
+            except asyncio.TimeoutError:
+                # Clients that never finish the close handshake would hold us
+                # here; drop their connections and cancel their handlers
+                # instead of waiting them out
+                for websocket in tuple(self._clients):
+                    transport = getattr(websocket, "transport", None)
+                    if transport is not None:
+                        transport.abort()
+                tasks = tuple(self._conn_tasks)
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
             self._server = None
         logger.info("WebSocket server stopped")
 
@@ -255,6 +554,9 @@ class SignalFileManager:
         self.base_dir = base_dir or Path("/tmp")
         self.CAPTURE_ACTIVE_FILE = self.base_dir / "fern_capture_active"
         self.RESULTS_FILE = self.base_dir / "fern_results"
+        # Plain string paths for the methods the GUI polls
+        self._active_str = os.fspath(self.CAPTURE_ACTIVE_FILE)
+        self._results_str = os.fspath(self.RESULTS_FILE)
 
     def set_capture_active(self, active: bool, metadata: Optional[Dict] = None) -> None:
         """Set capture active signal.
@@ -271,13 +573,81 @@ class SignalFileManager:
             if metadata:
                 data.update(metadata)
             self.CAPTURE_ACTIVE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            self.CAPTURE_ACTIVE_FILE.write_text(json.dumps(data))
+            _atomic_write(self.CAPTURE_ACTIVE_FILE, _dumps(data).encode())
         else:
             self.CAPTURE_ACTIVE_FILE.unlink(missing_ok=True)
 
     def is_capture_active(self) -> bool:
         """Check if capture is active."""
-        return self.CAPTURE_ACTIVE_FILE.exists()
+        return os.access(self._active_str, os.F_OK)
+
+    async def wait_capture_state_change(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the capture-active signal flips.
+
+        Uses kqueue directory notifications where available (macOS), so an
+        idle wait costs nothing; elsewhere polls with a 100ms-1s backoff.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            The new capture-active state.
+
+        Raises:
+            asyncio.TimeoutError: If the state did not change within timeout.
+        """
+        initial = self.is_capture_active()
+        if sys.platform == "darwin":
+            waiter = self._wait_kqueue(initial)
+        else:
+            waiter = self._wait_polling(initial)
+        return await asyncio.wait_for(waiter, timeout)
+
+    async def _wait_kqueue(self, initial: bool) -> bool:
+        """Wait for a state change using kqueue events on the base directory."""
+        # Platform check rather than hasattr so type checkers skip the
+        # kqueue calls on platforms whose select module lacks them
+        if sys.platform != "darwin":
+            return await self._wait_polling(initial)
+
+        # The signal file is created, renamed over and unlinked, so watch the
+        # directory entry list rather than the file itself
+        try:
+            dir_fd = os.open(self.base_dir, os.O_RDONLY)
+        except OSError:
+            return await self._wait_polling(initial)
+
+        kq = select.kqueue()
+        loop = asyncio.get_running_loop()
+        changed = asyncio.Event()
+        try:
+            kq.control([select.kevent(
+                dir_fd,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=select.KQ_NOTE_WRITE | select.KQ_NOTE_DELETE,
+            )], 0)
+            loop.add_reader(kq.fileno(), changed.set)
+            try:
+                # Re-check after registering so an earlier change is not missed
+                while (state := self.is_capture_active()) == initial:
+                    await changed.wait()
+                    changed.clear()
+                    kq.control(None, 8, 0)
+                return state
+            finally:
+                loop.remove_reader(kq.fileno())
+        finally:
+            kq.close()
+            os.close(dir_fd)
+
+    async def _wait_polling(self, initial: bool) -> bool:
+        """Wait for a state change by polling with exponential backoff."""
+        delay = _POLL_MIN_INTERVAL
+        while self.is_capture_active() == initial:
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, _POLL_MAX_INTERVAL)
+        return not initial
 
     def write_result(self, result: AnalysisResult) -> None:
         """Write analysis result to signal file.
@@ -286,15 +656,13 @@ class SignalFileManager:
             result: Analysis result to write.
         """
         self.RESULTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        self.RESULTS_FILE.write_text(json.dumps(asdict(result)))
+        _atomic_write(self.RESULTS_FILE, _dumps(result).encode())
 
     def read_result(self) -> Optional[AnalysisResult]:
         """Read latest analysis result."""
-        if not self.RESULTS_FILE.exists():
-            return None
-
         try:
-            data = json.loads(self.RESULTS_FILE.read_text())
+            with open(self._results_str, "rb") as f:
+                data = _loads(f.read())
             return AnalysisResult(**data)
         except Exception:
             return None
@@ -307,12 +675,35 @@ class SignalFileManager:
 from datetime import datetime
 
 
+def install_fast_event_loop() -> bool:
+    """Make new asyncio event loops use uvloop when it is installed.
+
+    Has no effect on a loop that is already running, so call this before
+    asyncio.run(). uvloop does not support Windows.
+
+    Returns:
+        True if uvloop's event loop policy was installed.
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
 def get_default_server() -> WebSocketServer:
     """Get default WebSocket server instance.
 
+    Installs uvloop as the event loop policy when available (see
+    install_fast_event_loop), so call this before starting the loop.
+
     Returns:
         Configured WebSocketServer instance.
     """
+    install_fast_event_loop()
     return WebSocketServer(signal_file=Path("/tmp/fern_status"))
 
 
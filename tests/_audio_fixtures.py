@@ -0,0 +1,27 @@
+"""Shared synthetic waveforms for analysis tests.
+
+Computed once at import in float32 and marked read-only, so tests can
+share them without re-running linspace/sin per test.
+"""
+
+import numpy as np
+
+SAMPLE_RATE = 44100
+
+
+def _sine(frequency: float, duration: float, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """Build a read-only float32 sine wave."""
+    t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
+    wave = np.sin(np.float32(2 * np.pi * frequency) * t)
+    wave.setflags(write=False)
+    return wave
+
+
+SILENCE_44K1 = np.zeros(SAMPLE_RATE, dtype=np.float32)
+SILENCE_44K1.setflags(write=False)
+
+SINE_440_44K1 = _sine(440, 1.0)
+SINE_150_44K1 = _sine(150, 1.0)
+SINE_220_44K1 = _sine(220, 1.0)
+SINE_220_10S = _sine(220, 10.0)
+LONG_SINE = SINE_220_10S
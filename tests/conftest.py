@@ -11,8 +11,9 @@ import numpy as np
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
     """Set up test environment variables and paths."""
-    # Use temporary directory for test data
-    with tempfile.TemporaryDirectory() as temp_dir:
+    # Use a temporary directory per pytest-xdist worker for test data
+    worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    with tempfile.TemporaryDirectory(prefix=f"fern-{worker_id}-") as temp_dir:
         test_home = Path(temp_dir) / ".fern"
         test_home.mkdir(parents=True, exist_ok=True)
         
@@ -22,6 +23,13 @@ def setup_test_environment():
                 yield {"test_home": test_home, "temp_dir": temp_dir}
 
 
+@pytest.fixture
+def mock_home(monkeypatch, tmp_path):
+    """Point Path.home() at an empty per-test directory."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    return tmp_path
+
+
 @pytest.fixture
 def mock_console():
     """Mock Rich console for testing CLI output."""
@@ -29,23 +37,28 @@ def mock_console():
     return mock_console
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_audio_data():
-    """Generate sample audio data for testing."""
+    """Generate sample audio data for testing.
+
+    Built once per session in float32 and marked read-only, since every
+    test shares the same array.
+    """
     # Generate 1 second of synthetic audio at 44100 Hz
     sample_rate = 44100
     duration = 1.0
-    t = np.linspace(0, duration, int(sample_rate * duration))
+    t = np.linspace(0, duration, int(sample_rate * duration), dtype=np.float32)
     
     # Generate a 440 Hz sine wave (A note)
     frequency = 440.0
-    audio_data = np.sin(2 * np.pi * frequency * t) * 0.3
+    audio_data = np.sin(np.float32(2 * np.pi * frequency) * t) * np.float32(0.3)
+    audio_data.setflags(write=False)
     
-    return audio_data.astype(np.float32)
+    return audio_data
 
 
 @pytest.fixture
-def mock_parselmouth_sound():
+def mock_parselmouth_sound(monkeypatch):
     """Mock parselmouth Sound object."""
     mock_sound = MagicMock()
     mock_pitch = MagicMock()
@@ -54,26 +67,13 @@ def mock_parselmouth_sound():
     pitch_values = np.array([440.0, 0.0, 455.0, 0.0, 442.0, 0.0, 448.0])
     mock_pitch.selected_array = {'frequency': pitch_values}
     
-    with patch("parselmouth.Sound", return_value=mock_sound):
-        with patch("parselmouth.praat.call", return_value=mock_pitch):
-            yield {
-                'sound': mock_sound,
-                'pitch': mock_pitch,
-                'pitch_values': pitch_values
-            }
-
-
-@pytest.fixture
-def mock_sounddevice():
-    """Mock sounddevice for testing."""
-    with patch("sounddevice.rec") as mock_rec:
-        with patch("sounddevice.wait") as mock_wait:
-            mock_rec.return_value = np.random.random((22050, 1)).astype(np.float32)
-            mock_wait.return_value = None
-            yield {
-                'rec': mock_rec,
-                'wait': mock_wait
-            }
+    monkeypatch.setattr("parselmouth.Sound", lambda *a, **k: mock_sound)
+    monkeypatch.setattr("parselmouth.praat.call", lambda *a, **k: mock_pitch)
+    return {
+        'sound': mock_sound,
+        'pitch': mock_pitch,
+        'pitch_values': pitch_values
+    }
 
 
 @pytest.fixture
@@ -87,19 +87,33 @@ def mock_librosa():
         yield {'load': mock_load}
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cli_runner():
-    """Create a Typer test runner for CLI testing."""
+    """Create a Typer test runner for CLI testing.
+
+    CliRunner keeps no state between invoke() calls, so one runner is
+    shared by every test in a module.
+    """
     from typer.testing import CliRunner
-    from fern.cli import app
     
-    runner = CliRunner()
-    return runner
+    return CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def default_config():
+    """Fern's built-in default configuration, built once per session."""
+    from fern.config import get_default_config
+
+    return get_default_config()
+
+
+@pytest.fixture(scope="session")
 def mock_config_data():
-    """Mock configuration data."""
+    """Mock configuration data.
+
+    Shared by the whole session: build variants with
+    ``{**mock_config_data, section: {...}}`` instead of mutating it.
+    """
     return {
         'target_pitch_range': {
             'min': 80.0,
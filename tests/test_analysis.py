@@ -2,8 +2,16 @@
 
 import pytest
 import numpy as np
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock
 from fern.analysis import extract_pitch_from_audio, extract_resonance_from_audio
+from tests._audio_fixtures import (
+    LONG_SINE,
+    SAMPLE_RATE,
+    SILENCE_44K1,
+    SINE_150_44K1,
+    SINE_220_44K1,
+    SINE_440_44K1,
+)
 
 
 class TestPitchAnalysis:
@@ -32,12 +40,8 @@ class TestPitchAnalysis:
 
     def test_extract_pitch_from_audio_with_silence(self):
         """Test pitch extraction with silence (all zeros)."""
-        # Create silence - all zeros
-        sample_rate = 44100
-        duration = 1.0
-        silence = np.zeros(int(sample_rate * duration), dtype=np.float32)
-        
-        result = extract_pitch_from_audio(silence, sample_rate)
+        # Silence - all zeros
+        result = extract_pitch_from_audio(SILENCE_44K1, SAMPLE_RATE)
         
         # Should return zero values for silence
         assert result['median_pitch'] == 0.0
@@ -61,18 +65,21 @@ class TestPitchAnalysis:
         assert isinstance(result, dict)
         assert 'error' not in result or result.get('error') is None
 
-    def test_extract_pitch_from_audio_parselmouth_error(self):
+    def test_extract_pitch_from_audio_parselmouth_error(self, monkeypatch):
         """Test handling of parselmouth errors."""
         # Create audio data that might cause parselmouth to fail
         audio_data = np.array([1, 2, 3], dtype=np.float32)
+
+        def failing_sound(*args, **kwargs):
+            raise Exception("Mock parselmouth error")
+
+        monkeypatch.setattr("parselmouth.Sound", failing_sound)
+        result = extract_pitch_from_audio(audio_data, 44100)
         
-        with patch("parselmouth.Sound", side_effect=Exception("Mock parselmouth error")):
-            result = extract_pitch_from_audio(audio_data, 44100)
-            
-            # Should return error structure
-            assert result['error'] == "Mock parselmouth error"
-            assert result['median_pitch'] == 0.0
-            assert result['mean_pitch'] == 0.0
+        # Should return error structure
+        assert result['error'] == "Mock parselmouth error"
+        assert result['median_pitch'] == 0.0
+        assert result['mean_pitch'] == 0.0
 
     def test_extract_pitch_from_audio_empty_array(self):
         """Test with empty audio array."""
@@ -98,11 +105,8 @@ class TestPitchAnalysis:
         assert isinstance(result, dict)
         assert 'median_pitch' in result
 
-    def test_extract_pitch_from_audio_mock_pitch_values(self, sample_audio_data):
+    def test_extract_pitch_from_audio_mock_pitch_values(self, sample_audio_data, monkeypatch):
         """Test with specific mock pitch values."""
-        from unittest.mock import MagicMock, patch
-        import numpy as np
-
         # Create mock pitch values - some voiced, some unvoiced
         expected_pitches = [440.0, 455.0, 442.0, 448.0]  # Non-zero values
         pitch_values = np.array([440.0, 0.0, 455.0, 0.0, 442.0, 0.0, 448.0])
@@ -114,41 +118,34 @@ class TestPitchAnalysis:
         mock_pitch = MagicMock()
         mock_pitch.selected_array = {'frequency': pitch_values}
 
-        with patch("fern.analysis.parselmouth.Sound", return_value=mock_sound):
-            with patch("fern.analysis.call", return_value=mock_pitch):
-                result = extract_pitch_from_audio(sample_audio_data, 44100)
+        monkeypatch.setattr("fern.analysis.parselmouth.Sound", lambda *a, **k: mock_sound)
+        monkeypatch.setattr("fern.analysis.call", lambda *a, **k: mock_pitch)
+        result = extract_pitch_from_audio(sample_audio_data, 44100)
 
-                # Verify the function processed the mocked pitch data
-                assert result['voiced_frames'] == expected_voiced
-                assert result['total_frames'] == expected_total
-                assert result['voicing_rate'] == expected_voiced / expected_total
-                assert result['median_pitch'] == np.median(expected_pitches)
+        # Verify the function processed the mocked pitch data
+        assert result['voiced_frames'] == expected_voiced
+        assert result['total_frames'] == expected_total
+        assert result['voicing_rate'] == expected_voiced / expected_total
+        assert result['median_pitch'] == np.median(expected_pitches)
 
     def test_extract_pitch_with_unvoiced_parts(self):
         """Test pitch extraction with mixed voiced/unvoiced audio."""
-        # Create audio with both voiced and unvoiced parts
-        sample_rate = 44100
-        duration = 1.0
-        t = np.linspace(0, duration, int(sample_rate * duration))
-        
         # Create mixed audio: voiced (sine wave) + unvoiced (noise)
-        voiced_part = np.sin(2 * np.pi * 220 * t[:len(t)//2])
-        unvoiced_part = np.random.random(len(t)//2) * 0.1
-        mixed_audio = np.concatenate([voiced_part, unvoiced_part]).astype(np.float32)
+        half = len(SINE_220_44K1) // 2
+        voiced_part = SINE_220_44K1[:half]
+        unvoiced_part = np.random.random(half).astype(np.float32) * np.float32(0.1)
+        mixed_audio = np.concatenate([voiced_part, unvoiced_part])
         
-        result = extract_pitch_from_audio(mixed_audio, sample_rate)
+        result = extract_pitch_from_audio(mixed_audio, SAMPLE_RATE)
         
         # Should have some voiced frames but not all
         assert 0 < result['voicing_rate'] < 1
         assert result['voiced_frames'] > 0
         assert result['total_frames'] > result['voiced_frames']
 
-    def test_extract_pitch_pitch_range_parameters(self):
+    def test_extract_pitch_pitch_range_parameters(self, monkeypatch):
         """Test that pitch extraction uses correct parameters."""
-        from unittest.mock import MagicMock, patch
-        import numpy as np
-
-        audio_data = np.sin(2 * np.pi * 440 * np.linspace(0, 1, 44100)).astype(np.float32)
+        audio_data = SINE_440_44K1
 
         # Track the call arguments
         call_args = []
@@ -159,18 +156,18 @@ class TestPitchAnalysis:
             mock_result.selected_array = {'frequency': np.array([440.0])}
             return mock_result
 
-        with patch("fern.analysis.parselmouth.Sound"):
-            with patch("fern.analysis.call", side_effect=mock_call):
-                result = extract_pitch_from_audio(audio_data, 44100)
+        monkeypatch.setattr("fern.analysis.parselmouth.Sound", lambda *a, **k: MagicMock())
+        monkeypatch.setattr("fern.analysis.call", mock_call)
+        result = extract_pitch_from_audio(audio_data, 44100)
 
-                # Verify parselmouth.praat.call was called exactly once with correct parameters
-                assert len(call_args) == 1
-                # Each call_args entry is a tuple of (sound, "To Pitch", time_step, f_min, f_max)
-                assert len(call_args[0]) >= 5
-                assert call_args[0][1] == "To Pitch"
-                assert call_args[0][2] == 0.01  # time_step
-                assert call_args[0][3] == 75    # f_min
-                assert call_args[0][4] == 600   # f_max
+        # Verify parselmouth.praat.call was called exactly once with correct parameters
+        assert len(call_args) == 1
+        # Each call_args entry is a tuple of (sound, "To Pitch", time_step, f_min, f_max)
+        assert len(call_args[0]) >= 5
+        assert call_args[0][1] == "To Pitch"
+        assert call_args[0][2] == 0.01  # time_step
+        assert call_args[0][3] == 75    # f_min
+        assert call_args[0][4] == 600   # f_max
 
 
 class TestResonanceAnalysis:
@@ -295,32 +292,21 @@ class TestAnalysisIntegration:
 
     def test_analysis_with_realistic_voice_parameters(self):
         """Test with realistic voice frequency parameters."""
-        # Create audio simulating typical voice range (80-250 Hz for speaking voice)
-        sample_rate = 44100
-        duration = 1.0
-        t = np.linspace(0, duration, int(sample_rate * duration))
-        
-        # Simulate a voice-like frequency (150 Hz)
-        voice_audio = np.sin(2 * np.pi * 150 * t).astype(np.float32)
-        
-        pitch_result = extract_pitch_from_audio(voice_audio, sample_rate)
+        # Simulate a voice-like frequency (150 Hz, within 80-250 Hz speaking range)
+        pitch_result = extract_pitch_from_audio(SINE_150_44K1, SAMPLE_RATE)
         
         # Should detect reasonable pitch
         assert 100 < pitch_result['median_pitch'] < 200
         assert pitch_result['voicing_rate'] > 0.5  # Most frames should be voiced
 
+    @pytest.mark.slow
     def test_performance_with_long_audio(self):
         """Test that analysis doesn't take too long with longer audio."""
         import time
         
-        # Create longer audio (10 seconds)
-        sample_rate = 44100
-        duration = 10.0
-        t = np.linspace(0, duration, int(sample_rate * duration))
-        long_audio = np.sin(2 * np.pi * 220 * t).astype(np.float32)
-        
+        # Longer audio (10 seconds)
         start_time = time.time()
-        result = extract_pitch_from_audio(long_audio, sample_rate)
+        result = extract_pitch_from_audio(LONG_SINE, SAMPLE_RATE)
         end_time = time.time()
         
         processing_time = end_time - start_time
@@ -2,10 +2,24 @@
 
 import pytest
 from unittest.mock import patch, MagicMock
+import numpy as np
 from typer.testing import CliRunner
 from fern.cli import app
 
 
+@pytest.fixture
+def mock_recording():
+    """Replace microphone recording with one second of silence."""
+    with patch("fern.cli._record_audio", return_value=np.zeros(44100, dtype=np.float32)) as mock_record:
+        yield mock_record
+
+
+@pytest.fixture(scope="module")
+def help_output(cli_runner):
+    """Top-level --help result, rendered once for the module."""
+    return cli_runner.invoke(app, ["--help"])
+
+
 class TestCLICommands:
     """Test CLI command functionality."""
 
@@ -17,31 +31,28 @@ class TestCLICommands:
         # Verify output contains expected content
         assert "Fern Voice Training" in result.output or "Status" in result.output
 
-    def test_status_command_data_directory_exists(self, cli_runner):
+    def test_status_command_data_directory_exists(self, cli_runner, mock_home, monkeypatch):
         """Test status command when data directory exists."""
-        with patch("pathlib.Path.home") as mock_home:
-            from pathlib import Path
-            mock_home.return_value = Path("/mock/home")
-            with patch("pathlib.Path.exists", return_value=True):
-                with patch("fern.db.get_default_db") as mock_db:
-                    mock_db.return_value.list_sessions.return_value = []
-                    mock_db.return_value.get_recent_readings.return_value = []
-                    result = cli_runner.invoke(app, ["status"])
-
-                    assert result.exit_code == 0
-
-    def test_status_command_data_directory_missing(self, cli_runner):
+        (mock_home / ".fern" / "clips").mkdir(parents=True)
+        mock_db = MagicMock()
+        mock_db.list_sessions.return_value = []
+        mock_db.get_recent_readings.return_value = []
+        monkeypatch.setattr("fern.db.get_default_db", lambda: mock_db)
+
+        result = cli_runner.invoke(app, ["status"])
+
+        assert result.exit_code == 0
+
+    def test_status_command_data_directory_missing(self, cli_runner, mock_home, monkeypatch):
         """Test status command when data directory doesn't exist."""
-        with patch("pathlib.Path.home") as mock_home:
-            from pathlib import Path
-            mock_home.return_value = Path("/mock/home")
-            with patch("pathlib.Path.exists", return_value=False):
-                with patch("fern.db.get_default_db") as mock_db:
-                    mock_db.return_value.list_sessions.return_value = []
-                    mock_db.return_value.get_recent_readings.return_value = []
-                    result = cli_runner.invoke(app, ["status"])
+        mock_db = MagicMock()
+        mock_db.list_sessions.return_value = []
+        mock_db.get_recent_readings.return_value = []
+        monkeypatch.setattr("fern.db.get_default_db", lambda: mock_db)
 
-                    assert result.exit_code == 0
+        result = cli_runner.invoke(app, ["status"])
+
+        assert result.exit_code == 0
 
     def test_version_command(self, cli_runner):
         """Test the version command displays correctly."""
@@ -51,9 +62,8 @@ class TestCLICommands:
         # Verify version was printed
         assert "Fern v0.1.0" in result.output
 
-    def test_test_command_with_mocked_audio(self, cli_runner, mock_sounddevice):
-        """Test the test command with mocked audio recording."""
-        mock_pitch_result = {
+    @pytest.mark.parametrize("mock_pitch_result", [
+        {
             'median_pitch': 440.0,
             'mean_pitch': 445.0,
             'min_pitch': 430.0,
@@ -62,16 +72,8 @@ class TestCLICommands:
             'voiced_frames': 100,
             'total_frames': 100,
             'voicing_rate': 1.0
-        }
-
-        with patch("fern.analysis.extract_pitch_from_audio", return_value=mock_pitch_result):
-            result = cli_runner.invoke(app, ["test", "--duration", "1"])
-
-            assert result.exit_code == 0
-
-    def test_test_command_with_no_pitch_detected(self, cli_runner, mock_sounddevice):
-        """Test the test command when no pitch is detected."""
-        mock_pitch_result = {
+        },
+        {
             'median_pitch': 0.0,
             'mean_pitch': 0.0,
             'min_pitch': 0.0,
@@ -80,14 +82,16 @@ class TestCLICommands:
             'voiced_frames': 0,
             'total_frames': 100,
             'voicing_rate': 0.0
-        }
-
+        },
+    ], ids=["pitch-detected", "no-pitch-detected"])
+    def test_test_command_pitch_outputs(self, cli_runner, mock_recording, mock_pitch_result):
+        """Test the test command with and without a detected pitch."""
         with patch("fern.analysis.extract_pitch_from_audio", return_value=mock_pitch_result):
             result = cli_runner.invoke(app, ["test", "--duration", "1"])
 
             assert result.exit_code == 0
 
-    def test_test_command_with_error(self, cli_runner, mock_sounddevice):
+    def test_test_command_with_error(self, cli_runner, mock_recording):
         """Test the test command handles errors gracefully."""
         with patch("fern.analysis.extract_pitch_from_audio", side_effect=Exception("Test error")):
             result = cli_runner.invoke(app, ["test", "--duration", "1"])
@@ -95,7 +99,7 @@ class TestCLICommands:
             # Should return error exit code
             assert result.exit_code != 0
 
-    def test_test_command_with_custom_device(self, cli_runner, mock_sounddevice):
+    def test_test_command_with_custom_device(self, cli_runner, mock_recording):
         """Test the test command with custom device ID."""
         mock_pitch_result = {
             'median_pitch': 220.0,
@@ -109,21 +113,16 @@ class TestCLICommands:
         }
 
         with patch("fern.analysis.extract_pitch_from_audio", return_value=mock_pitch_result):
-            with patch("sounddevice.rec") as mock_rec:
-                mock_rec.return_value = mock_sounddevice['rec'].return_value
+            result = cli_runner.invoke(app, ["test", "--duration", "1", "--device", "1"])
 
-                result = cli_runner.invoke(app, ["test", "--duration", "1", "--device", "1"])
-
-                assert result.exit_code == 0
-                # Verify device parameter was passed to sounddevice.rec
-                mock_rec.assert_called_once()
+            assert result.exit_code == 0
+            # Verify device parameter was passed to the recorder
+            mock_recording.assert_called_once_with(1, 1, 44100)
 
-    def test_cli_help_command(self, cli_runner):
+    def test_cli_help_command(self, help_output):
         """Test the CLI help command works."""
-        result = cli_runner.invoke(app, ["--help"])
-        
-        assert result.exit_code == 0
-        assert "Voice training feedback companion" in result.output
+        assert help_output.exit_code == 0
+        assert "Voice training feedback companion" in help_output.output
 
     def test_cli_subcommand_help(self, cli_runner):
         """Test CLI subcommand help works."""
@@ -146,15 +145,14 @@ class TestCLICommands:
         
         assert console is not None
 
-    def test_cli_commands_are_registered(self, cli_runner):
+    def test_cli_commands_are_registered(self):
         """Test that all CLI commands are properly registered."""
-        result = cli_runner.invoke(app, ["--help"])
-        
-        assert result.exit_code == 0
-        # Check that expected commands appear in help
-        assert "status" in result.output
-        assert "test" in result.output
-        assert "version" in result.output
+        # Unnamed commands take the callback's name, as Typer does
+        registered = {
+            cmd.name or cmd.callback.__name__.replace("_", "-")
+            for cmd in app.registered_commands
+        }
+        assert {"status", "test", "version"} <= registered
 
 
 class TestCLIIntegration:
@@ -171,15 +169,13 @@ class TestCLIIntegration:
         assert app is not None
 
     def test_cli_main_entry_point(self):
-        """Test CLI main entry point."""
+        """Test CLI main entry point runs the Typer app."""
+        import fern.cli
+
         with patch("fern.cli.app") as mock_app:
-            # Import and call main
-            from fern.cli import app
-            with patch("typer.run") as mock_run:
-                # Simulate __name__ == "__main__" block
-                with patch("builtins.__name__", "__main__"):
-                    app()  # This would call typer.run(app) in the main block
-                    # The main block execution would call typer.run(app)
+            fern.cli.main()
+
+        mock_app.assert_called_once_with()
 
 
 class TestCLIErrorHandling:
@@ -201,12 +197,13 @@ class TestCLIErrorHandling:
 
             assert result.exit_code == 0
 
-    def test_console_exception_handling(self, cli_runner):
+    def test_console_exception_handling(self, cli_runner, monkeypatch):
         """Test that console exceptions are handled."""
         # This test verifies the CLI doesn't crash on exceptions
         # The actual behavior depends on exception handling in commands
-        with patch("pathlib.Path.home", return_value="/nonexistent"):
-            result = cli_runner.invoke(app, ["status"])
+        from pathlib import Path
+        monkeypatch.setattr(Path, "home", lambda: "/nonexistent")
+        result = cli_runner.invoke(app, ["status"])
 
-            # Should handle gracefully (either succeed or fail cleanly)
-            assert result.exit_code in [0, 1]
\ No newline at end of file
+        # Should handle gracefully (either succeed or fail cleanly)
+        assert result.exit_code in [0, 1]
\ No newline at end of file
@@ -0,0 +1,308 @@
+"""Tests for Fern database operations."""
+
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from fern.db import Database, get_default_db
+from fern.models import Reading, Session, SessionSummary, Target
+
+
+@pytest.fixture
+def db(tmp_path):
+    """A fresh, initialized database in a temporary directory."""
+    database = Database(tmp_path / "fern.db")
+    database.initialize()
+    yield database
+    database.close()
+
+
+class TestIterReadings:
+    """Test streaming readings out of a session."""
+
+    def _add_readings(self, db, session_id, count):
+        start = datetime(2024, 1, 1, 12, 0, 0)
+        return db.create_readings([
+            Reading(session_id=session_id, timestamp=start + timedelta(seconds=i), median_pitch=100 + i)
+            for i in range(count)
+        ])
+
+    def test_iter_matches_get_readings(self, db):
+        """Test the iterator yields every reading in timestamp order."""
+        session_id = db.create_session(Session(name="s"))
+        self._add_readings(db, session_id, 600)
+
+        iterated = [r.id for r in db.iter_readings_for_session(session_id)]
+
+        assert iterated == [r.id for r in db.get_readings_for_session(session_id)]
+        assert len(iterated) == 600
+
+    def test_write_while_iterator_partly_consumed(self, db):
+        """Test writes made mid-iteration are kept when the iterator is dropped."""
+        session_id = db.create_session(Session(name="s"))
+        self._add_readings(db, session_id, 600)
+
+        it = db.iter_readings_for_session(session_id)
+        next(it)
+        reading_id = db.create_reading(Reading(session_id=session_id, median_pitch=200))
+        del it
+
+        assert db.get_reading(reading_id) is not None
+
+    def test_write_between_batches_is_seen_once(self, db):
+        """Test iteration resumes correctly after a write between batches."""
+        session_id = db.create_session(Session(name="s"))
+        self._add_readings(db, session_id, 600)
+
+        seen = []
+        for reading in db.iter_readings_for_session(session_id):
+            seen.append(reading.id)
+            if len(seen) == 300:
+                db.create_reading(Reading(session_id=session_id, timestamp=datetime(2030, 1, 1)))
+
+        assert len(seen) == len(set(seen)) == 601
+
+
+
+class TestDeleteSession:
+    """Test deleting sessions."""
+
+    def test_delete_session_removes_its_readings(self, db):
+        """Test readings go with their session and other sessions are untouched."""
+        session_id = db.create_session(Session(name="doomed"))
+        other_id = db.create_session(Session(name="kept"))
+        reading_ids = db.create_readings([
+            Reading(session_id=session_id, median_pitch=150),
+            Reading(session_id=session_id, median_pitch=160),
+        ])
+        kept_id = db.create_reading(Reading(session_id=other_id, median_pitch=170))
+
+        assert db.delete_session(session_id)
+
+        assert db.get_session(session_id) is None
+        assert all(db.get_reading(reading_id) is None for reading_id in reading_ids)
+        assert db.get_readings_for_session(session_id) == []
+        assert db.get_reading(kept_id) is not None
+
+    def test_delete_missing_session(self, db):
+        """Test deleting an unknown session reports nothing was deleted."""
+        assert not db.delete_session(12345)
+
+
+class TestSessionAggregates:
+    """Test the SQL aggregates behind close_session and get_session_summary."""
+
+    @pytest.fixture
+    def session_id(self, db):
+        session_id = db.create_session(Session(name="s"))
+        db.create_readings([
+            Reading(session_id=session_id, median_pitch=pitch, voicing_rate=voicing, std_pitch=std)
+            for pitch, voicing, std in [
+                (100.0, 0.5, 10.0),
+                (150.0, 0.7, 20.0),
+                (200.0, 0.9, 30.0),
+                (250.0, 1.0, 40.0),
+            ]
+        ])
+        return session_id
+
+    def test_close_session(self, db, session_id):
+        """Test closing a session stores its reading count and averages."""
+        session = db.close_session(session_id)
+
+        assert session.end_time is not None
+        assert session.reading_count == 4
+        assert session.avg_median_pitch == pytest.approx(175.0)
+        assert session.avg_voicing_rate == pytest.approx(0.775)
+
+    def test_close_session_without_readings(self, db):
+        """Test an empty session closes with zeroed statistics."""
+        session = db.close_session(db.create_session(Session(name="empty")))
+
+        assert session.end_time is not None
+        assert session.reading_count == 0
+        assert session.avg_median_pitch == 0.0
+        assert session.avg_voicing_rate == 0.0
+
+    def test_close_missing_session(self, db):
+        """Test closing an unknown session returns None."""
+        assert db.close_session(12345) is None
+
+    def test_summary_with_target(self, db, session_id):
+        """Test the summary counts readings inside the target range."""
+        summary = db.get_session_summary(session_id, Target(min_pitch=140.0, max_pitch=210.0))
+
+        assert summary.total_readings == 4
+        assert summary.readings_in_range == 2
+        assert summary.readings_out_of_range == 2
+        assert summary.in_range_percentage == pytest.approx(50.0)
+        assert summary.avg_median_pitch == pytest.approx(175.0)
+        assert summary.min_median_pitch == 100.0
+        assert summary.max_median_pitch == 250.0
+        assert summary.pitch_std == pytest.approx(25.0)
+        assert summary.avg_voicing_rate == pytest.approx(0.775)
+
+    @pytest.mark.parametrize("target", [None, Target(min_pitch=0.0, max_pitch=210.0)])
+    def test_summary_without_usable_target(self, db, session_id, target):
+        """Test no reading counts as in range without a usable target."""
+        summary = db.get_session_summary(session_id, target)
+
+        assert summary.total_readings == 4
+        assert summary.readings_in_range == 0
+        assert summary.readings_out_of_range == 4
+        assert summary.in_range_percentage == 0.0
+        assert summary.avg_median_pitch == pytest.approx(175.0)
+
+    def test_summary_without_readings(self, db):
+        """Test an empty session summarises to the defaults."""
+        session_id = db.create_session(Session(name="empty"))
+
+        summary = db.get_session_summary(session_id, Target(min_pitch=140.0, max_pitch=210.0))
+
+        assert summary == SessionSummary(session_id=session_id)
+
+
+class TestDefaultDb:
+    """Test the shared default database."""
+
+    def test_default_db_is_reused(self, mock_home):
+        """Test repeated lookups return one instance under the home directory."""
+        db = get_default_db()
+
+        assert get_default_db() is db
+        assert db.db_path == mock_home / ".fern" / "fern.db"
+
+
+def test_other_connections_keep_default_datetime_binding():
+    """Test importing fern.db does not change how other connections bind datetimes."""
+    conn = sqlite3.connect(":memory:")
+    try:
+        value = conn.execute("SELECT ?", (datetime(2024, 1, 1, 12, 0, 0),)).fetchone()[0]
+    finally:
+        conn.close()
+
+    assert value == "2024-01-01 12:00:00"
+
+# Schema written by Fern before timestamps moved to epoch microseconds
+_V1_SCHEMA = """
+    CREATE TABLE sessions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT,
+        start_time TEXT NOT NULL,
+        end_time TEXT,
+        target_id INTEGER,
+        reading_count INTEGER DEFAULT 0,
+        avg_median_pitch REAL DEFAULT 0.0,
+        avg_voicing_rate REAL DEFAULT 0.0,
+        notes TEXT,
+        FOREIGN KEY (target_id) REFERENCES targets(id)
+    );
+    CREATE TABLE readings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        session_id INTEGER NOT NULL,
+        timestamp TEXT NOT NULL,
+        median_pitch REAL DEFAULT 0.0,
+        mean_pitch REAL DEFAULT 0.0,
+        min_pitch REAL DEFAULT 0.0,
+        max_pitch REAL DEFAULT 0.0,
+        std_pitch REAL DEFAULT 0.0,
+        voiced_frames INTEGER DEFAULT 0,
+        total_frames INTEGER DEFAULT 0,
+        voicing_rate REAL DEFAULT 0.0,
+        f1_mean REAL DEFAULT 0.0,
+        f2_mean REAL DEFAULT 0.0,
+        f3_mean REAL DEFAULT 0.0,
+        f1_std REAL DEFAULT 0.0,
+        f2_std REAL DEFAULT 0.0,
+        f3_std REAL DEFAULT 0.0,
+        clip_path TEXT,
+        duration_seconds REAL DEFAULT 0.0,
+        device_id INTEGER,
+        FOREIGN KEY (session_id) REFERENCES sessions(id)
+    );
+    CREATE TABLE targets (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL DEFAULT 'Default',
+        created_at TEXT NOT NULL,
+        min_pitch REAL NOT NULL DEFAULT 80.0,
+        max_pitch REAL NOT NULL DEFAULT 250.0,
+        voice_type TEXT,
+        target_f2 REAL,
+        is_active INTEGER DEFAULT 1
+    );
+    CREATE TABLE metadata (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+    INSERT INTO metadata (key, value) VALUES ('schema_version', '1');
+    INSERT INTO targets (id, name, created_at, min_pitch, max_pitch, is_active)
+        VALUES (1, 'Alto', '2024-01-01T09:00:00', 160.0, 220.0, 1);
+    INSERT INTO sessions (id, name, start_time, end_time, target_id, reading_count)
+        VALUES (1, 'Morning', '2024-01-02T08:00:00', '2024-01-02T08:30:00.250000', 1, 2);
+    INSERT INTO sessions (id, name, start_time) VALUES (2, 'Open', '2024-01-03T19:15:00');
+    INSERT INTO readings (id, session_id, timestamp, median_pitch, voicing_rate)
+        VALUES (1, 1, '2024-01-02T08:00:05.123456', 180.5, 0.8);
+    INSERT INTO readings (id, session_id, timestamp, median_pitch, voicing_rate)
+        VALUES (2, 1, '2024-01-02T08:00:10', 190.0, 0.6);
+"""
+
+
+class TestMigration:
+    """Test upgrading databases written by older schema versions."""
+
+    @pytest.fixture
+    def v1_path(self, tmp_path):
+        path = tmp_path / "fern.db"
+        conn = sqlite3.connect(path)
+        conn.executescript(_V1_SCHEMA)
+        conn.close()
+        return path
+
+    def test_v1_database_is_migrated(self, v1_path):
+        """Test rows, timestamps, version and indexes survive the upgrade."""
+        db = Database(v1_path)
+        try:
+            db.initialize()
+
+            session = db.get_session(1)
+            assert session.name == "Morning"
+            assert session.start_time == datetime(2024, 1, 2, 8, 0, 0)
+            assert session.end_time == datetime(2024, 1, 2, 8, 30, 0, 250000)
+            assert session.target_id == 1
+            assert db.get_session(2).end_time is None
+
+            readings = db.get_readings_for_session(1)
+            assert [r.id for r in readings] == [1, 2]
+            assert readings[0].timestamp == datetime(2024, 1, 2, 8, 0, 5, 123456)
+            assert readings[0].median_pitch == 180.5
+            assert readings[1].voicing_rate == 0.6
+
+            targets = db.list_targets()
+            assert [(t.name, t.created_at) for t in targets] == [
+                ("Alto", datetime(2024, 1, 1, 9, 0, 0))
+            ]
+            assert db.check_schema()
+        finally:
+            db.close()
+
+        conn = sqlite3.connect(v1_path)
+        try:
+            assert conn.execute("PRAGMA user_version").fetchone()[0] == Database.SCHEMA_VERSION == 3
+            assert conn.execute("SELECT COUNT(*) FROM metadata WHERE key = 'schema_version'").fetchone()[0] == 0
+            indexes = {
+                row[0] for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%'"
+                )
+            }
+            assert indexes == {
+                "idx_readings_session_ts",
+                "idx_readings_timestamp",
+                "idx_sessions_target_start",
+                "idx_targets_active",
+            }
+            foreign_keys = conn.execute("PRAGMA foreign_key_list(readings)").fetchall()
+            assert [(fk[2], fk[6]) for fk in foreign_keys] == [("sessions", "CASCADE")]
+            assert conn.execute("SELECT typeof(timestamp) FROM readings").fetchone()[0] == "integer"
+        finally:
+            conn.close()
@@ -0,0 +1,47 @@
+"""Tests for Fern data models."""
+
+import json
+import math
+from datetime import datetime
+
+import pytest
+
+from fern import models
+from fern.models import Reading
+
+
+class TestJsonBytes:
+    """Test compact JSON serialization of models."""
+
+    def _reading(self):
+        return Reading(
+            session_id=1,
+            timestamp=datetime(2024, 1, 1, 12, 0, 0),
+            median_pitch=float("nan"),
+            max_pitch=float("inf"),
+            min_pitch=float("-inf"),
+        )
+
+    def test_non_finite_floats_are_kept(self):
+        """Test NaN and infinity are not written as null."""
+        data = json.loads(self._reading().to_json_bytes())
+
+        assert math.isnan(data["median_pitch"])
+        assert data["max_pitch"] == float("inf")
+        assert data["min_pitch"] == float("-inf")
+
+    def test_non_finite_output_does_not_depend_on_orjson(self, monkeypatch):
+        """Test the encoding is the same with and without orjson."""
+        reading = self._reading()
+        encoded = reading.to_json_bytes()
+
+        monkeypatch.setattr(models, "ORJSON_AVAILABLE", False)
+
+        assert reading.to_json_bytes() == encoded
+
+    @pytest.mark.skipif(not models.ORJSON_AVAILABLE, reason="orjson not installed")
+    def test_finite_reading_uses_orjson(self):
+        """Test finite models still take the orjson path."""
+        reading = Reading(session_id=1, timestamp=datetime(2024, 1, 1), median_pitch=150.0)
+
+        assert reading.to_json_bytes() == models.orjson.dumps(reading)
@@ -0,0 +1,185 @@
+"""Tests for the Fern WebSocket server."""
+
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+import websockets
+
+from fern.websocket_server import (
+    _CLIENT_QUEUE_SIZE,
+    _STOP_TIMEOUT,
+    ANALYSIS_BROADCAST_HZ,
+    AnalysisResult,
+    WebSocketServer,
+)
+
+# Long enough for the throttle window to close
+WINDOW = 2 / ANALYSIS_BROADCAST_HZ
+
+
+@pytest_asyncio.fixture
+async def server():
+    """A running server on a free local port."""
+    srv = WebSocketServer(host="127.0.0.1", port=0)
+    await srv.start()
+    srv.url = f"ws://127.0.0.1:{srv._server.sockets[0].getsockname()[1]}"
+    yield srv
+    await srv.stop()
+
+
+async def wait_for_clients(srv, count):
+    """Wait until the server has registered ``count`` clients."""
+    for _ in range(100):
+        if len(srv._clients) == count:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"expected {count} clients, have {len(srv._clients)}")
+
+
+async def recv_json(client, timeout=1.0):
+    """Receive and decode one message."""
+    return json.loads(await asyncio.wait_for(client.recv(), timeout))
+
+
+async def assert_silent(client, timeout=0.2):
+    """Assert that nothing arrives within ``timeout`` seconds."""
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(client.recv(), timeout)
+
+
+class TestBroadcast:
+    """Test analysis broadcasts to connected clients."""
+
+    @pytest.mark.asyncio
+    async def test_fan_out_to_every_client(self, server):
+        """Test every connected client receives a broadcast."""
+        async with websockets.connect(server.url) as c1, websockets.connect(server.url) as c2:
+            await wait_for_clients(server, 2)
+
+            await server.broadcast_analysis(AnalysisResult(median_pitch=150.0))
+
+            for client in (c1, c2):
+                message = await recv_json(client)
+                assert message["type"] == "analysis"
+                assert message["data"]["median_pitch"] == 150.0
+
+    @pytest.mark.asyncio
+    async def test_throttle_coalesces_to_newest(self, server):
+        """Test results within one window collapse to the newest."""
+        async with websockets.connect(server.url) as client:
+            await wait_for_clients(server, 1)
+
+            for pitch in (100.0, 101.0, 102.0):
+                await server.broadcast_analysis(AnalysisResult(median_pitch=pitch))
+
+            assert (await recv_json(client))["data"]["median_pitch"] == 100.0
+            assert (await recv_json(client))["data"]["median_pitch"] == 102.0
+            await assert_silent(client)
+
+    @pytest.mark.asyncio
+    async def test_repeated_result_is_not_resent(self, server):
+        """Test an unchanged result is only sent once."""
+        async with websockets.connect(server.url) as client:
+            await wait_for_clients(server, 1)
+
+            await server.broadcast_analysis(AnalysisResult(median_pitch=120.0))
+            await recv_json(client)
+            await asyncio.sleep(WINDOW)
+            await server.broadcast_analysis(AnalysisResult(median_pitch=120.0))
+
+            await assert_silent(client)
+
+    @pytest.mark.asyncio
+    async def test_new_client_gets_latest_result(self, server):
+        """Test a client connecting later starts with the last result."""
+        async with websockets.connect(server.url) as first:
+            await wait_for_clients(server, 1)
+            await server.broadcast_analysis(AnalysisResult(median_pitch=120.0))
+            await recv_json(first)
+
+            await first.send(json.dumps({"command": "set_encoding", "encoding": "json"}))
+            assert (await recv_json(first))["type"] == "encoding"
+
+            async with websockets.connect(server.url) as late:
+                assert (await recv_json(late))["data"]["median_pitch"] == 120.0
+                await wait_for_clients(server, 2)
+
+                await asyncio.sleep(WINDOW)
+                await server.broadcast_analysis(AnalysisResult(median_pitch=120.0))
+                await assert_silent(late)
+
+    @pytest.mark.asyncio
+    async def test_reply_follows_queued_broadcast(self):
+        """Test a direct reply never overtakes an earlier broadcast."""
+        srv = WebSocketServer()
+
+        class RecordingClient:
+            def __init__(self):
+                self.sent = []
+
+            async def send(self, message):
+                self.sent.append(json.loads(message)["type"])
+
+        client = RecordingClient()
+        writer = srv._register_client(client)
+        try:
+            await srv._send_status(client, {})
+            await srv.broadcast_analysis(AnalysisResult(median_pitch=130.0))
+            await srv._process_message(client, '{"command":"ping"}')
+            for _ in range(3):
+                await asyncio.sleep(0)
+
+            assert client.sent == ["status", "analysis", "pong"]
+        finally:
+            writer.cancel()
+            await srv.stop()
+
+    @pytest.mark.asyncio
+    async def test_full_queue_drops_broadcasts(self):
+        """Test broadcasts to a client that stopped reading are dropped."""
+        srv = WebSocketServer()
+
+        class StalledClient:
+            async def send(self, message):
+                await asyncio.Event().wait()
+
+        writer = srv._register_client(StalledClient())
+        try:
+            for _ in range(_CLIENT_QUEUE_SIZE + 3):
+                srv._enqueue_broadcast("{}")
+            assert srv._dropped_messages == 3
+        finally:
+            writer.cancel()
+
+
+class TestStop:
+    """Test shutting the server down."""
+
+    @pytest.mark.asyncio
+    async def test_stop_with_unresponsive_client(self):
+        """Test stop() gives up on a client that never completes the close handshake."""
+        srv = WebSocketServer(host="127.0.0.1", port=0)
+        await srv.start()
+        port = srv._server.sockets[0].getsockname()[1]
+
+        # Complete the opening handshake, then never read or answer again
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(
+            b"GET / HTTP/1.1\r\nHost: localhost\r\nUpgrade: websocket\r\n"
+            b"Connection: Upgrade\r\nSec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n"
+            b"Sec-WebSocket-Version: 13\r\n\r\n"
+        )
+        await writer.drain()
+        assert b"101" in await reader.readline()
+        await wait_for_clients(srv, 1)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await srv.stop()
+
+        assert loop.time() - started < _STOP_TIMEOUT + 1.0
+        assert not srv._clients
+        assert not srv._conn_tasks
+        writer.close()